@@ -0,0 +1,164 @@
+"""Resume and cover letter generation shared by the CLI and the web app."""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable
+
+import groq_client
+
+logger = logging.getLogger(__name__)
+
+# Scrape-step files that are no longer needed once content is generated
+TEMPLATE_FILES = ("prompt.txt", "prompt-cover.txt", "resume-template.tex")
+
+
+def _generate_to_file(generate: Callable[..., str], path: Path, **kwargs: Any) -> str:
+    """Stream a Groq generation into ``path`` and finalize it atomically.
+
+    Text is appended to ``<name>.partial`` as it arrives so progress is
+    visible on disk; once complete, the fence-stripped result replaces
+    ``path`` in one step.
+
+    Args:
+        generate: Groq generator function accepting an ``on_chunk`` callback
+        path: Final output file
+        **kwargs: Arguments for ``generate``
+
+    Returns:
+        The cleaned generated text
+    """
+    partial = path.with_name(f"{path.name}.partial")
+    try:
+        with partial.open("w", encoding="utf-8", buffering=1) as f:
+            text = groq_client.strip_code_fences(generate(on_chunk=f.write, **kwargs))
+            f.seek(0)
+            f.truncate()
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(partial, path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    return text
+
+
+def generate(
+    job_data: dict[str, Any],
+    folder_path: str | Path,
+    model: str = groq_client.DEFAULT_MODEL,
+    with_cover_letter: bool = True,
+) -> dict[str, Any]:
+    """Generate a tailored resume and cover letter into a job folder.
+
+    Both calls only need the job description and the folder's master resume,
+    so they run concurrently; each response streams into its file as it is
+    generated.
+
+    Args:
+        job_data: Job data dict with title, company, description
+        folder_path: Path to job folder containing resume-template.tex
+        model: Groq model to use
+        with_cover_letter: Also write Cover_Letter.txt (False when it was
+            already generated, e.g. in a packed batch request)
+
+    Returns:
+        Dict with the generated texts (``tailored_resume``, ``cover_letter``;
+        the latter None when skipped) and their paths
+        (``tailored_resume_path``, ``cover_letter_path``)
+
+    Raises:
+        FileNotFoundError: If master resume not found
+        APIKeyError: If API key is missing or invalid
+    """
+    folder = Path(folder_path)
+
+    master_resume_path = folder / "resume-template.tex"
+    try:
+        master_resume = master_resume_path.read_text(encoding="utf-8")
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Master resume not found: {master_resume_path}") from e
+
+    tailored_resume_path = folder / "Resume.tex"
+    cover_letter_path = folder / "Cover_Letter.txt"
+
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        resume_future = ex.submit(
+            _generate_to_file,
+            groq_client.generate_tailored_resume,
+            tailored_resume_path,
+            job_description=job_data["description"],
+            master_resume=master_resume,
+            model=model,
+        )
+        futures = [resume_future]
+        if with_cover_letter:
+            futures.append(
+                ex.submit(
+                    _generate_to_file,
+                    groq_client.generate_cover_letter,
+                    cover_letter_path,
+                    job_description=job_data["description"],
+                    tailored_resume=master_resume,
+                    company_name=job_data["company"],
+                    job_title=job_data["title"],
+                    model=model,
+                )
+            )
+
+        for future in as_completed(futures):
+            future.result()
+            if future is resume_future:
+                logger.info(f"Resume.tex generated: {tailored_resume_path}")
+            else:
+                logger.info(f"Cover_Letter.txt generated: {cover_letter_path}")
+
+    return {
+        "tailored_resume": resume_future.result(),
+        "cover_letter": futures[1].result() if with_cover_letter else None,
+        "tailored_resume_path": tailored_resume_path,
+        "cover_letter_path": cover_letter_path,
+    }
+
+
+def cleanup_templates(folder_path: str | Path) -> list[str]:
+    """Remove template files after successful generation to keep folder clean.
+
+    Args:
+        folder_path: Path to job folder
+
+    Returns:
+        List of removed filenames
+    """
+    folder = Path(folder_path)
+
+    # Resolve the folder once and unlinkat() each name relative to it; a
+    # missing file is just a failed unlink instead of a stat + unlink pair
+    dir_fd: int | None = None
+    if os.unlink in os.supports_dir_fd:
+        try:
+            dir_fd = os.open(folder, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        except OSError:
+            dir_fd = None
+
+    removed: list[str] = []
+    try:
+        for filename in TEMPLATE_FILES:
+            try:
+                if dir_fd is not None:
+                    os.unlink(filename, dir_fd=dir_fd)
+                else:
+                    os.unlink(folder / filename)
+                removed.append(filename)
+                logger.debug(f"Cleaned up: {filename}")
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.warning(f"Failed to remove {filename}: {e}")
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+    return removed
@@ -0,0 +1,142 @@
+"""On-disk cache for scraped job pages and Groq completions."""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import json_utils
+from paths import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 24 * 60 * 60  # seconds
+
+_enabled = True
+_ttl: float = DEFAULT_TTL
+
+
+def configure(enabled: bool | None = None, ttl: float | None = None) -> None:
+    """Change cache behaviour for the rest of the process (e.g. from CLI flags).
+
+    Args:
+        enabled: Whether cached entries are read and written
+        ttl: Maximum age of a cache entry in seconds
+    """
+    global _enabled, _ttl
+
+    if enabled is not None:
+        _enabled = enabled
+    if ttl is not None:
+        _ttl = ttl
+
+
+def is_enabled() -> bool:
+    """Check whether caching is on.
+
+    The ``CRACKATS_NO_CACHE=1`` environment variable disables the cache
+    regardless of :func:`configure`.
+
+    Returns:
+        True if cache entries should be used
+    """
+    if os.environ.get("CRACKATS_NO_CACHE", "").lower() in ("1", "true", "yes"):
+        return False
+    return _enabled
+
+
+def make_key(*parts: Any) -> str:
+    """Build a content-addressed cache key from JSON-serializable parts.
+
+    Args:
+        *parts: Values that determine the cached result
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(json_utils.dumpb(list(parts))).hexdigest()
+
+
+def _entry_path(namespace: str, key: str) -> Path:
+    """Get the file backing a cache entry, creating its namespace directory."""
+    directory = get_cache_dir() / namespace
+    directory.mkdir(exist_ok=True)
+    return directory / key
+
+
+def get(namespace: str, key: str) -> bytes | None:
+    """Read a cache entry if caching is enabled and the entry is fresh.
+
+    Args:
+        namespace: Cache sub-directory (e.g. "groq", "scrape")
+        key: Entry key from :func:`make_key`
+
+    Returns:
+        Cached bytes, or None on a miss
+    """
+    if not is_enabled():
+        return None
+    try:
+        path = _entry_path(namespace, key)
+        if time.time() - path.stat().st_mtime > _ttl:
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def put(namespace: str, key: str, data: bytes) -> None:
+    """Store a cache entry atomically; failures are logged and ignored.
+
+    Args:
+        namespace: Cache sub-directory (e.g. "groq", "scrape")
+        key: Entry key from :func:`make_key`
+        data: Bytes to store
+    """
+    if not is_enabled():
+        return
+    try:
+        path = _entry_path(namespace, key)
+    except OSError as e:
+        logger.debug(f"Cache unavailable: {e}")
+        return
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f"Failed to write cache entry {path}: {e}")
+        tmp.unlink(missing_ok=True)
+
+
+def prune() -> int:
+    """Delete expired entries (and stale temp files) from every namespace.
+
+    Returns:
+        Number of files removed
+    """
+    removed = 0
+    cutoff = time.time() - _ttl
+    try:
+        with os.scandir(get_cache_dir()) as entries:
+            namespaces = [entry.path for entry in entries if entry.is_dir()]
+    except OSError:
+        return 0
+    for namespace in namespaces:
+        try:
+            with os.scandir(namespace) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                            removed += 1
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    if removed:
+        logger.debug(f"Pruned {removed} expired cache entries")
+    return removed
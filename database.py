@@ -1,23 +1,257 @@
 """Database models for job application tracking."""
 
-import json
+import atexit
 import logging
 import sqlite3
-from datetime import datetime
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, Sequence
 
+import json_utils
 from exceptions import DatabaseError, ValidationError
 from paths import ensure_database_location, backup_database, get_db_path
 
 logger = logging.getLogger(__name__)
 
 
+# Per-connection tuning; journal_mode=WAL is persistent and set once in init_db()
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=10737418240",
+    "PRAGMA foreign_keys=ON",
+)
+
+# Columns stored on the applications table; tags live in application_tags
+_APP_COLUMNS = (
+    "id",
+    "company",
+    "title",
+    "url",
+    "status",
+    "notes",
+    "date_applied",
+    "date_created",
+    "resume_path",
+    "cover_letter_path",
+    "salary",
+    "location",
+)
+_COLUMNS = (*_APP_COLUMNS, "tags")
+
+# date_created is stored as Unix seconds so it sorts and indexes as an integer
+_APPLICATIONS_SCHEMA = """(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company TEXT NOT NULL,
+    title TEXT NOT NULL,
+    url TEXT,
+    status TEXT DEFAULT 'saved',
+    notes TEXT,
+    date_applied TEXT,
+    date_created INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+    resume_path TEXT,
+    cover_letter_path TEXT,
+    salary TEXT,
+    location TEXT
+)"""
+
+_UPDATABLE_FIELDS = frozenset(_COLUMNS) - {"id", "date_created"}
+
+# Tags are aggregated with an ASCII unit separator, which cannot collide with a comma in a tag,
+# in the order they were given (rows predating the position column fall back to insertion order)
+_TAG_SEP = "\x1f"
+# _APP_COLUMNS is a fixed whitelist of column names; no user input reaches this SQL
+_SELECT_APPLICATIONS = (
+    f"SELECT {', '.join(_APP_COLUMNS)}, "  # noqa: S608
+    "(SELECT GROUP_CONCAT(tag, char(31)) FROM "
+    "(SELECT tag FROM application_tags WHERE app_id = applications.id ORDER BY position, rowid)) AS tags "
+    "FROM applications"
+)
+
+
 def get_db_path_dynamic() -> Path:
     """Get database path with migration support."""
     return ensure_database_location()
 
 
+@lru_cache(maxsize=64)
+def _update_sql(fields: tuple[str, ...]) -> str:
+    """Build the UPDATE statement for a given set of fields.
+
+    Args:
+        fields: Column names to set, in parameter order
+
+    Returns:
+        Parameterized UPDATE statement
+    """
+    return f"UPDATE applications SET {', '.join(f'{field} = ?' for field in fields)} WHERE id = ?"
+
+
+def _tag_list(tags: str | list | None) -> list[str]:
+    """Normalize tags given as a list or JSON array string.
+
+    Args:
+        tags: Tags as a list, JSON-encoded list, or None
+
+    Returns:
+        List of tag strings
+    """
+    if not tags:
+        return []
+    if isinstance(tags, str):
+        tags = json_utils.loads(tags)
+    return [str(tag) for tag in tags]
+
+
+def _tag_rows(app_id: int, tags: str | list | None) -> list[tuple[int, int, str]]:
+    """Build application_tags rows that keep the tags in their given order.
+
+    Args:
+        app_id: Application ID
+        tags: Tags as a list, JSON-encoded list, or None
+
+    Returns:
+        (app_id, position, tag) tuples; repeated tags are dropped on insert
+    """
+    return [(app_id, position, tag) for position, tag in enumerate(_tag_list(tags))]
+
+
+def _replace_tags(conn: sqlite3.Connection, app_id: int, tags: str | list | None) -> None:
+    """Replace the tags of an existing application.
+
+    Args:
+        conn: Connection with an open transaction
+        app_id: Application ID
+        tags: New tags
+    """
+    conn.execute("DELETE FROM application_tags WHERE app_id = ?", (app_id,))
+    # Selecting from applications skips the insert when the application does not exist
+    conn.executemany(
+        "INSERT OR IGNORE INTO application_tags (app_id, position, tag) "
+        "SELECT id, ?, ? FROM applications WHERE id = ?",
+        [(position, tag, app_id) for app_id, position, tag in _tag_rows(app_id, tags)],
+    )
+
+
+def _row_to_dict(row: sqlite3.Row) -> dict[str, Any]:
+    """Convert an applications row to its API dictionary.
+
+    Args:
+        row: Row from the applications table
+
+    Returns:
+        Application dictionary with decoded tags
+    """
+    data = dict(zip(row.keys(), row))
+    data["tags"] = data["tags"].split(_TAG_SEP) if data["tags"] else []
+    data["date_created"] = _format_timestamp(data["date_created"])
+    return data
+
+
+def _apply_pragmas(conn: sqlite3.Connection) -> None:
+    """Apply per-connection performance PRAGMAs.
+
+    Args:
+        conn: Connection to configure
+    """
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+
+def _close_connection(conn: sqlite3.Connection) -> None:
+    """Run ``PRAGMA optimize`` and close the connection.
+
+    Args:
+        conn: Connection to close
+    """
+    try:
+        conn.execute("PRAGMA optimize")
+    finally:
+        conn.close()
+
+
+def _migrate_legacy_tags(cursor: sqlite3.Cursor) -> None:
+    """Move tags from the old JSON ``applications.tags`` column into application_tags.
+
+    Args:
+        cursor: Cursor on the database being initialized
+    """
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(applications)")}
+    if "tags" not in columns:
+        return
+
+    rows: list[tuple[int, int, str]] = []
+    for app_id, tags in cursor.execute("SELECT id, tags FROM applications WHERE tags IS NOT NULL").fetchall():
+        try:
+            rows.extend(_tag_rows(app_id, tags))
+        except ValueError:
+            logger.warning(f"Dropping unparseable tags for application {app_id}: {tags!r}")
+    cursor.executemany("INSERT OR IGNORE INTO application_tags (app_id, position, tag) VALUES (?, ?, ?)", rows)
+
+    try:
+        cursor.execute("ALTER TABLE applications DROP COLUMN tags")
+    except sqlite3.OperationalError:
+        # SQLite < 3.35 cannot drop columns; clear the data so it is not migrated twice
+        cursor.execute("UPDATE applications SET tags = NULL")
+    logger.info(f"Migrated {len(rows)} tags to the application_tags table")
+
+
+def _migrate_date_created(conn: sqlite3.Connection) -> None:
+    """Rebuild a legacy applications table whose date_created is TEXT.
+
+    Follows SQLite's create-copy-drop-rename procedure with foreign keys
+    disabled so application_tags rows survive the rebuild. Any legacy
+    ``tags`` column is dropped along the way.
+
+    Args:
+        conn: Connection used by init_db()
+    """
+    columns = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(applications)")}
+    if columns.get("date_created", "").upper() == "INTEGER":
+        return
+
+    cols = ", ".join(_APP_COLUMNS)
+    converted = ", ".join(
+        "COALESCE(CAST(strftime('%s', date_created) AS INTEGER), CAST(strftime('%s', 'now') AS INTEGER))"
+        if col == "date_created"
+        else col
+        for col in _APP_COLUMNS
+    )
+
+    conn.commit()
+    conn.execute("PRAGMA foreign_keys=OFF")
+    try:
+        conn.execute("DROP TABLE IF EXISTS applications_new")
+        conn.execute(f"CREATE TABLE applications_new {_APPLICATIONS_SCHEMA}")
+        # cols/converted are built only from the fixed _APP_COLUMNS whitelist
+        conn.execute(f"INSERT INTO applications_new ({cols}) SELECT {converted} FROM applications")  # noqa: S608
+        conn.execute("DROP TABLE applications")
+        conn.execute("ALTER TABLE applications_new RENAME TO applications")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.execute("PRAGMA foreign_keys=ON")
+    logger.info("Migrated applications.date_created to Unix timestamps")
+
+
+def _format_timestamp(ts: int | None) -> str | None:
+    """Format a Unix timestamp the way SQLite's CURRENT_TIMESTAMP does (UTC).
+
+    Args:
+        ts: Seconds since the epoch
+
+    Returns:
+        ``YYYY-MM-DD HH:MM:SS`` string, or None
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(ts)) if ts is not None else None
+
+
 def init_db() -> None:
     """Initialize SQLite database with applications table."""
     db_path = get_db_path_dynamic()
@@ -26,26 +260,72 @@ def init_db() -> None:
         conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
 
+        cursor.execute("PRAGMA journal_mode=WAL")
+        _apply_pragmas(conn)
+
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS applications {_APPLICATIONS_SCHEMA}")
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS applications (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                company TEXT NOT NULL,
-                title TEXT NOT NULL,
-                url TEXT,
-                status TEXT DEFAULT 'saved',
-                notes TEXT,
-                date_applied TEXT,
-                date_created TEXT DEFAULT CURRENT_TIMESTAMP,
-                resume_path TEXT,
-                cover_letter_path TEXT,
-                salary TEXT,
-                location TEXT,
-                tags TEXT
+            CREATE TABLE IF NOT EXISTS application_tags (
+                app_id INTEGER NOT NULL REFERENCES applications(id) ON DELETE CASCADE,
+                tag TEXT NOT NULL,
+                position INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (app_id, tag)
             )
         """)
+        if "position" not in {row[1] for row in cursor.execute("PRAGMA table_info(application_tags)")}:
+            cursor.execute("ALTER TABLE application_tags ADD COLUMN position INTEGER NOT NULL DEFAULT 0")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tags_tag ON application_tags(tag)")
+        _migrate_legacy_tags(cursor)
+        _migrate_date_created(conn)
+
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_apps_status_date ON applications(status, date_created DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_apps_date_created ON applications(date_created DESC)")
+
+        # Per-status counters kept current by triggers so get_stats() avoids a table scan
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS application_stats (
+                status TEXT PRIMARY KEY,
+                cnt INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_apps_stats_insert
+            AFTER INSERT ON applications WHEN NEW.status IS NOT NULL
+            BEGIN
+                INSERT INTO application_stats (status, cnt) VALUES (NEW.status, 1)
+                ON CONFLICT(status) DO UPDATE SET cnt = cnt + 1;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_apps_stats_delete
+            AFTER DELETE ON applications WHEN OLD.status IS NOT NULL
+            BEGIN
+                UPDATE application_stats SET cnt = cnt - 1 WHERE status = OLD.status;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_apps_stats_update
+            AFTER UPDATE OF status ON applications WHEN OLD.status IS NOT NEW.status
+            BEGIN
+                UPDATE application_stats SET cnt = cnt - 1 WHERE status = OLD.status;
+                INSERT INTO application_stats (status, cnt) SELECT NEW.status, 1 WHERE NEW.status IS NOT NULL
+                ON CONFLICT(status) DO UPDATE SET cnt = cnt + 1;
+            END
+        """)
+
+        # Resync counters once per startup (covers databases created before the triggers existed)
+        cursor.execute("DELETE FROM application_stats")
+        cursor.execute("""
+            INSERT INTO application_stats (status, cnt)
+            SELECT status, COUNT(*) FROM applications WHERE status IS NOT NULL GROUP BY status
+        """)
+        cursor.executemany(
+            "INSERT OR IGNORE INTO application_stats (status, cnt) VALUES (?, 0)",
+            [(status,) for status in Application.STATUSES],
+        )
 
         conn.commit()
-        conn.close()
+        _close_connection(conn)
         logger.debug("Database initialized successfully")
     except Exception as e:
         raise DatabaseError("Failed to initialize database", details=str(e)) from e
@@ -54,7 +334,8 @@ def init_db() -> None:
 class Application:
     """Job application model."""
 
-    STATUSES = [
+    # Pipeline order (used for stats and seeding); validate against STATUS_SET
+    STATUSES = (
         "saved",
         "applied",
         "shortlisted",
@@ -63,7 +344,11 @@ class Application:
         "offer",
         "rejected",
         "withdrawn",
-    ]
+    )
+    STATUS_SET = frozenset(STATUSES)
+    STATUSES_STR = ", ".join(STATUSES)
+
+    __slots__ = _COLUMNS
 
     def __init__(self, **kwargs: Any) -> None:
         self.id: int | None = kwargs.get("id")
@@ -80,6 +365,36 @@ class Application:
         self.location: str = kwargs.get("location", "")
         self.tags: str | list = kwargs.get("tags", "[]")
 
+    @classmethod
+    def _from_row(cls, row: Sequence[Any]) -> "Application":
+        """Build an application from a row in ``_COLUMNS`` order.
+
+        Args:
+            row: Database row
+
+        Returns:
+            Application instance
+        """
+        obj = cls.__new__(cls)
+        (
+            obj.id,
+            obj.company,
+            obj.title,
+            obj.url,
+            obj.status,
+            obj.notes,
+            obj.date_applied,
+            obj.date_created,
+            obj.resume_path,
+            obj.cover_letter_path,
+            obj.salary,
+            obj.location,
+            tags,
+        ) = row
+        obj.tags = tags.split(_TAG_SEP) if tags else []
+        obj.date_created = _format_timestamp(obj.date_created)  # type: ignore[arg-type]
+        return obj
+
     def to_dict(self) -> dict[str, Any]:
         """Convert application to dictionary."""
         return {
@@ -95,17 +410,66 @@ class Application:
             "cover_letter_path": self.cover_letter_path,
             "salary": self.salary,
             "location": self.location,
-            "tags": json.loads(self.tags) if isinstance(self.tags, str) else self.tags,
+            "tags": json_utils.loads(self.tags) if isinstance(self.tags, str) else self.tags,
         }
 
 
 class ApplicationDB:
     """Database operations for applications."""
 
-    @staticmethod
-    def _get_connection() -> sqlite3.Connection:
-        """Get database connection."""
-        return sqlite3.connect(get_db_path_dynamic())
+    _conn: sqlite3.Connection | None = None
+    _lock = threading.RLock()
+    # Cache-aside for get_by_id: app_id -> (expiry, row); invalidated on writes
+    _cache: dict[int, tuple[float, sqlite3.Row]] = {}
+    _CACHE_TTL = 60.0
+
+    @classmethod
+    def _get_connection(cls) -> sqlite3.Connection:
+        """Get the shared database connection, initializing the schema on first use."""
+        if cls._conn is None:
+            init_db()
+            # Autocommit mode: write methods open explicit transactions via transaction()
+            conn = sqlite3.connect(get_db_path_dynamic(), check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            _apply_pragmas(conn)
+            atexit.register(cls._close)
+            cls._conn = conn
+        return cls._conn
+
+    @classmethod
+    def _close(cls) -> None:
+        """Close the shared connection if it is open."""
+        with cls._lock:
+            if cls._conn is not None:
+                _close_connection(cls._conn)
+                cls._conn = None
+
+    @classmethod
+    @contextmanager
+    def transaction(cls) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed writes in a single transaction with one commit.
+
+        Nested blocks, including the write methods of this class, join the
+        outermost transaction. The shared connection stays locked to the
+        calling thread until the block exits.
+
+        Yields:
+            The shared database connection
+        """
+        with cls._lock:
+            conn = cls._get_connection()
+            if conn.in_transaction:
+                yield conn
+                return
+
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                cls._cache.clear()
+                raise
+            conn.commit()
 
     @classmethod
     def create(cls, app: Application) -> int:
@@ -120,40 +484,66 @@ class ApplicationDB:
         Raises:
             DatabaseError: If creation fails
         """
-        try:
-            conn = cls._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                INSERT INTO applications 
-                (company, title, url, status, notes, date_applied, resume_path, cover_letter_path, salary, location, tags)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    app.company,
-                    app.title,
-                    app.url,
-                    app.status,
-                    app.notes,
-                    app.date_applied,
-                    app.resume_path,
-                    app.cover_letter_path,
-                    app.salary,
-                    app.location,
-                    json.dumps(app.tags) if isinstance(app.tags, list) else app.tags,
-                ),
+        return cls.create_many([app])[0]
+
+    @classmethod
+    def create_many(cls, apps: list[Application]) -> list[int]:
+        """Create several applications in a single transaction.
+
+        Args:
+            apps: Applications to create
+
+        Returns:
+            IDs of the created applications, in input order
+
+        Raises:
+            DatabaseError: If creation fails
+        """
+        if not apps:
+            return []
+
+        rows = [
+            (
+                app.company,
+                app.title,
+                app.url,
+                app.status,
+                app.notes,
+                app.date_applied,
+                app.resume_path,
+                app.cover_letter_path,
+                app.salary,
+                app.location,
             )
+            for app in apps
+        ]
 
-            app_id = cursor.lastrowid
-            if app_id is None:
-                raise DatabaseError("Failed to get last row ID after insert")
-            app_id = int(app_id)  # type: ignore[redundant-cast]
+        try:
+            with cls.transaction() as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO applications 
+                    (company, title, url, status, notes, date_applied, resume_path, cover_letter_path, salary, location)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    rows,
+                )
+                # Rows inserted in one transaction on a single writer get consecutive IDs
+                last_id = int(conn.execute("SELECT last_insert_rowid()").fetchone()[0])
+                if not last_id:
+                    raise DatabaseError("Failed to get last row ID after insert")
+
+                app_ids = list(range(last_id - len(rows) + 1, last_id + 1))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO application_tags (app_id, position, tag) VALUES (?, ?, ?)",
+                    [row for app_id, app in zip(app_ids, apps) for row in _tag_rows(app_id, app.tags)],
+                )
 
-            conn.commit()
-            conn.close()
-            logger.info(f"Created application with ID: {app_id}")
-            return app_id
+            if len(app_ids) == 1:
+                logger.info(f"Created application with ID: {last_id}")
+            else:
+                logger.info(f"Created {len(app_ids)} applications with IDs {app_ids[0]}-{last_id}")
+            return app_ids
         except Exception as e:
             raise DatabaseError("Failed to create application", details=str(e)) from e
 
@@ -171,40 +561,17 @@ class ApplicationDB:
             DatabaseError: If query fails
         """
         try:
-            conn = cls._get_connection()
-            cursor = conn.cursor()
-
-            if status:
-                cursor.execute(
-                    "SELECT * FROM applications WHERE status = ? ORDER BY date_created DESC",
-                    (status,),
-                )
-            else:
-                cursor.execute("SELECT * FROM applications ORDER BY date_created DESC")
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            applications: list[dict[str, Any]] = []
-            for row in rows:
-                app = Application(
-                    id=row[0],
-                    company=row[1],
-                    title=row[2],
-                    url=row[3],
-                    status=row[4],
-                    notes=row[5],
-                    date_applied=row[6],
-                    date_created=row[7],
-                    resume_path=row[8],
-                    cover_letter_path=row[9],
-                    salary=row[10],
-                    location=row[11],
-                    tags=row[12],
-                )
-                applications.append(app.to_dict())
-
-            return applications
+            with cls._lock:
+                conn = cls._get_connection()
+                if status:
+                    rows = conn.execute(
+                        f"{_SELECT_APPLICATIONS} WHERE status = ? ORDER BY date_created DESC",
+                        (status,),
+                    ).fetchall()
+                else:
+                    rows = conn.execute(f"{_SELECT_APPLICATIONS} ORDER BY date_created DESC").fetchall()
+
+            return [_row_to_dict(row) for row in rows]
         except Exception as e:
             raise DatabaseError("Failed to get applications", details=str(e)) from e
 
@@ -222,31 +589,20 @@ class ApplicationDB:
             DatabaseError: If query fails
         """
         try:
-            conn = cls._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT * FROM applications WHERE id = ?", (app_id,))
-            row = cursor.fetchone()
-            conn.close()
+            with cls._lock:
+                cached = cls._cache.get(app_id)
+                if cached and cached[0] > time.monotonic():
+                    row = cached[1]
+                else:
+                    conn = cls._get_connection()
+                    row = conn.execute(f"{_SELECT_APPLICATIONS} WHERE id = ?", (app_id,)).fetchone()
+                    if row:
+                        cls._cache[app_id] = (time.monotonic() + cls._CACHE_TTL, row)
 
             if not row:
                 return None
 
-            return Application(
-                id=row[0],
-                company=row[1],
-                title=row[2],
-                url=row[3],
-                status=row[4],
-                notes=row[5],
-                date_applied=row[6],
-                date_created=row[7],
-                resume_path=row[8],
-                cover_letter_path=row[9],
-                salary=row[10],
-                location=row[11],
-                tags=row[12],
-            )
+            return Application._from_row(row)
         except Exception as e:
             raise DatabaseError(f"Failed to get application {app_id}", details=str(e)) from e
 
@@ -262,44 +618,24 @@ class ApplicationDB:
             DatabaseError: If update fails
             ValidationError: If invalid fields provided
         """
-        allowed_fields = [
-            "company",
-            "title",
-            "url",
-            "status",
-            "notes",
-            "date_applied",
-            "resume_path",
-            "cover_letter_path",
-            "salary",
-            "location",
-            "tags",
-        ]
-
-        updates: list[str] = []
-        values: list[Any] = []
-
-        for key, value in kwargs.items():
-            if key not in allowed_fields:
+        for key in kwargs:
+            if key not in _UPDATABLE_FIELDS:
                 raise ValidationError(f"Invalid field: {key}")
-            updates.append(f"{key} = ?")
-            if key == "tags" and isinstance(value, list):
-                values.append(json.dumps(value))
-            else:
-                values.append(value)
 
-        if not updates:
+        if not kwargs:
             return
 
-        try:
-            values.append(app_id)
-            query = f"UPDATE applications SET {', '.join(updates)} WHERE id = ?"
+        # Sorted field order keeps the SQL text stable so SQLite's statement cache is reused
+        fields = tuple(sorted(key for key in kwargs if key != "tags"))
+        values: list[Any] = [kwargs[key] for key in fields]
 
-            conn = cls._get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, values)
-            conn.commit()
-            conn.close()
+        try:
+            with cls.transaction() as conn:
+                if fields:
+                    conn.execute(_update_sql(fields), [*values, app_id])
+                if "tags" in kwargs:
+                    _replace_tags(conn, app_id, kwargs["tags"])
+                cls._cache.pop(app_id, None)
             logger.info(f"Updated application {app_id}")
         except Exception as e:
             raise DatabaseError(f"Failed to update application {app_id}", details=str(e)) from e
@@ -315,16 +651,43 @@ class ApplicationDB:
             DatabaseError: If deletion fails
         """
         try:
-            conn = cls._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("DELETE FROM applications WHERE id = ?", (app_id,))
-            conn.commit()
-            conn.close()
+            with cls.transaction() as conn:
+                conn.execute("DELETE FROM applications WHERE id = ?", (app_id,))
+                cls._cache.pop(app_id, None)
             logger.info(f"Deleted application {app_id}")
         except Exception as e:
             raise DatabaseError(f"Failed to delete application {app_id}", details=str(e)) from e
 
+    @classmethod
+    def delete_many(cls, app_ids: list[int]) -> int:
+        """Delete several applications with one statement in a single transaction.
+
+        Args:
+            app_ids: Application IDs to delete
+
+        Returns:
+            Number of applications deleted
+
+        Raises:
+            DatabaseError: If deletion fails
+        """
+        if not app_ids:
+            return 0
+
+        try:
+            with cls.transaction() as conn:
+                # json_each binds the whole ID list as one parameter (no variable-count limit)
+                cursor = conn.execute(
+                    "DELETE FROM applications WHERE id IN (SELECT value FROM json_each(?))",
+                    (json_utils.dumps(app_ids),),
+                )
+                for app_id in app_ids:
+                    cls._cache.pop(app_id, None)
+            logger.info(f"Deleted {cursor.rowcount} applications")
+            return cursor.rowcount
+        except Exception as e:
+            raise DatabaseError("Failed to delete applications", details=str(e)) from e
+
     @classmethod
     def get_stats(cls) -> dict[str, int]:
         """Get application statistics.
@@ -336,12 +699,9 @@ class ApplicationDB:
             DatabaseError: If query fails
         """
         try:
-            conn = cls._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT status, COUNT(*) FROM applications GROUP BY status")
-            stats: dict[str, int] = dict(cursor.fetchall())
-            conn.close()
+            with cls._lock:
+                cursor = cls._get_connection().execute("SELECT status, cnt FROM application_stats WHERE cnt > 0")
+                stats: dict[str, int] = dict(cursor.fetchall())
 
             # Ensure all statuses exist
             for status in Application.STATUSES:
@@ -363,23 +723,16 @@ class ApplicationDB:
             DatabaseError: If reset fails
         """
         try:
-            conn = cls._get_connection()
-            cursor = conn.cursor()
-
-            # Get count before deletion
-            cursor.execute("SELECT COUNT(*) FROM applications")
-            count = cursor.fetchone()[0]
+            with cls.transaction() as conn:
+                # Get count before deletion
+                count = conn.execute("SELECT COUNT(*) FROM applications").fetchone()[0]
 
-            # Delete all applications
-            cursor.execute("DELETE FROM applications")
-            conn.commit()
-            conn.close()
+                # Delete all applications
+                conn.execute("DELETE FROM applications")
+                cls._cache.clear()
 
             logger.warning(f"Database reset: deleted {count} applications")
             return count
         except Exception as e:
             raise DatabaseError("Failed to reset database", details=str(e)) from e
 
-
-# Initialize database on import
-init_db()
@@ -1,14 +1,30 @@
 """File operations for job folder creation."""
 
 import logging
+import os
 import shutil
-import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from textwrap import TextWrapper
+from typing import Callable
 
 from exceptions import FileOperationError, TemplateNotFoundError
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# ioctl request for a copy-on-write clone (Btrfs, XFS, bcachefs)
+_FICLONE = 0x40049409
+
+# path -> (mtime_ns, size, text) for read_text_cached
+_text_cache: dict[str, tuple[int, int, str]] = {}
+
 
 def ensure_job_folder(base_dir: str | Path, folder_name: str) -> Path:
     """Ensure job folder exists, creating it if necessary.
@@ -21,11 +37,43 @@ def ensure_job_folder(base_dir: str | Path, folder_name: str) -> Path:
         Path object for the created folder
     """
     path = Path(base_dir) / folder_name
-    path.mkdir(parents=True, exist_ok=True)
+    os.makedirs(path, exist_ok=True)
     logger.debug(f"Ensured job folder exists: {path}")
     return path
 
 
+@lru_cache(maxsize=16)
+def _wrapper(width: int) -> TextWrapper:
+    """Get a shared TextWrapper for the given width.
+
+    Args:
+        width: Maximum line width
+
+    Returns:
+        Cached TextWrapper instance
+    """
+    return TextWrapper(width=width, break_long_words=False, break_on_hyphens=False)
+
+
+def _write_bytes(path: Path, data: bytes, fsync: bool = False) -> None:
+    """Write already-encoded data to a file with raw ``os.write`` calls.
+
+    Args:
+        path: File to create or truncate
+        data: Encoded file contents
+        fsync: Flush the data to stable storage before returning
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
 def _wrap(text: str | None, width: int = 80) -> str:
     """Wrap text to specified width.
 
@@ -39,10 +87,11 @@ def _wrap(text: str | None, width: int = 80) -> str:
     lines: list[str] = []
     for raw in (text or "").splitlines():
         ln = raw.strip()
-        if not ln:
-            lines.append("")
+        # Short lines need no wrapping (tabs would still be expanded by TextWrapper)
+        if len(ln) <= width and "\t" not in ln:
+            lines.append(ln)
         else:
-            lines.extend(textwrap.fill(ln, width, break_long_words=False, break_on_hyphens=False).splitlines())
+            lines.extend(_wrapper(width).wrap(ln))
     return "\n".join(lines)
 
 
@@ -71,7 +120,7 @@ def write_description(
         parts.extend([f"Source: {source_url.strip()}", ""])
     if text := _wrap(description, width).rstrip():
         parts.append(text)
-    path.write_text("\n".join(parts).rstrip() + "\n", encoding="utf-8")
+    _write_bytes(path, ("\n".join(parts).rstrip() + "\n").encode("utf-8"))
     logger.debug(f"Wrote description to: {path}")
     return path
 
@@ -97,11 +146,48 @@ def write_prompt_file(
     """
     path = folder / filename
     parts = [p for p in [_wrap(prompt, width).rstrip(), _wrap(description, width).rstrip()] if p]
-    path.write_text("\n\n".join(parts).rstrip() + "\n", encoding="utf-8")
+    _write_bytes(path, ("\n\n".join(parts).rstrip() + "\n").encode("utf-8"))
     logger.debug(f"Wrote prompt file to: {path}")
     return path
 
 
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy file contents inside the kernel, preferring a copy-on-write reflink.
+
+    Hard links are deliberately not used: the copy must stay independent of
+    the master template when either file is edited in place.
+
+    Args:
+        src: Source file
+        dst: Destination file (created or truncated)
+    """
+    if fcntl is None or not hasattr(os, "copy_file_range"):
+        # shutil already uses fcopyfile/sendfile where the platform has them
+        shutil.copyfile(src, dst)
+        return
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            pass
+
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if not copied:
+                    break
+                remaining -= copied
+        except OSError:
+            # e.g. EXDEV on older kernels; restart with a userspace copy
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst)
+
+
 def copy_template(
     template_path: Path,
     target_dir: Path,
@@ -120,16 +206,34 @@ def copy_template(
     Raises:
         TemplateNotFoundError: If template file doesn't exist
     """
-    if not template_path.exists():
-        raise TemplateNotFoundError(f"Template not found: {template_path}")
+    try:
+        os.stat(template_path)
+    except FileNotFoundError as e:
+        raise TemplateNotFoundError(f"Template not found: {template_path}") from e
 
     target = target_dir / (target_name or template_path.name)
-    if not target.exists():
-        shutil.copyfile(template_path, target)
+    try:
+        os.stat(target)
+    except FileNotFoundError:
+        _copy_file(template_path, target)
         logger.debug(f"Copied template from {template_path} to {target}")
     return target
 
 
+def bulk_write(ops: list[Callable[[], Path | None]], max_workers: int = 4) -> list[Path | None]:
+    """Run independent file-writing operations concurrently.
+
+    Args:
+        ops: Zero-argument callables, each writing one file
+        max_workers: Maximum number of worker threads
+
+    Returns:
+        Results of the callables, in the same order as ``ops``
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(lambda op: op(), ops))
+
+
 def safe_write_text(filepath: Path, content: str) -> None:
     """Safely write text to file with validation.
 
@@ -141,12 +245,34 @@ def safe_write_text(filepath: Path, content: str) -> None:
         FileOperationError: If write fails
     """
     try:
-        filepath.write_text(content, encoding="utf-8")
+        _write_bytes(filepath, content.encode("utf-8"))
         logger.debug(f"Wrote file: {filepath}")
     except Exception as e:
         raise FileOperationError(f"Failed to write file: {filepath}", details=str(e)) from e
 
 
+def atomic_write_text(filepath: Path, content: str) -> None:
+    """Replace a file's contents atomically.
+
+    The text is written and fsynced to a hidden sibling temp file, then
+    renamed over ``filepath``, so readers (and a crash) only ever see the
+    old or the new contents, never a truncated file.
+
+    Args:
+        filepath: Path to write to
+        content: Content to write
+    """
+    filepath = Path(filepath)
+    tmp = filepath.with_name(f".{filepath.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        _write_bytes(tmp, content.encode("utf-8"), fsync=True)
+        os.replace(tmp, filepath)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    logger.debug(f"Atomically wrote file: {filepath}")
+
+
 def safe_read_text(filepath: Path) -> str:
     """Safely read text from file.
 
@@ -165,3 +291,28 @@ def safe_read_text(filepath: Path) -> str:
         return content
     except Exception as e:
         raise FileOperationError(f"Failed to read file: {filepath}", details=str(e)) from e
+
+
+def read_text_cached(filepath: Path) -> str:
+    """Read a rarely-changing text file, reusing the last read while it is unchanged.
+
+    Entries are keyed by path and validated against the file's mtime and size,
+    so a rewrite (including an atomic rename) is picked up on the next call.
+
+    Args:
+        filepath: Path to read from
+
+    Returns:
+        File contents
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    key = os.fspath(filepath)
+    st = os.stat(key)
+    cached = _text_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    text = Path(key).read_text(encoding="utf-8")
+    _text_cache[key] = (st.st_mtime_ns, st.st_size, text)
+    return text
@@ -1,45 +1,113 @@
 """Groq API client for resume and cover letter generation."""
 
-import json
+import atexit
 import logging
 import os
+import random
 import re
-import ssl
-import urllib.error
-import urllib.request
+import string
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, NoReturn
 
+import cache
+import json_utils
+import rate_limiter
 from exceptions import APIAccessDeniedError, APIKeyError, APIRateLimitError
 
+if TYPE_CHECKING:
+    # ssl (OpenSSL initialization) and http.client are imported on first API call
+    import http.client
+    import ssl
+
 logger = logging.getLogger(__name__)
 
 GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 DEFAULT_MODEL = "llama-3.3-70b-versatile"
 
+_GROQ_URL = urllib.parse.urlsplit(GROQ_API_URL)
+
+# Keep-alive connections to api.groq.com, reused across calls and threads
+# (sized for generate-batch: 4 folders x 2 concurrent calls)
+_POOL_SIZE = 8
+_pool: list["http.client.HTTPSConnection"] = []
+_pool_lock = threading.Lock()
+_ssl_lock = threading.Lock()
+
+# Resolved once by init(); replaced at runtime via set_api_key()
+_API_KEY: str | None = None
+
+# Transient failures (rate limits, gateway errors) are retried with backoff
+_MAX_RETRIES = 3
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRY_DELAY = 60.0
+
+# Client-side pacing is off unless GROQ_RPM / GROQ_TPM are set: limits depend on
+# the account tier (free tier for llama-3.3-70b-versatile: 30 RPM, 12000 TPM)
+_DEFAULT_RPM = 0
+_DEFAULT_TPM = 0
+
+_ENV_LINE_RE = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*)$")
+# LaTeX commands are case-sensitive; only headings that start a line count
+_SECTION_RE = re.compile(r"(?m)^[ \t]*\\section\*?\{([^}]+)\}")
+
+# Opening fence (with optional language tag) of a fenced model response
+_FENCE_OPEN_RE = re.compile(r"```[A-Za-z]*[ \t]*\n?")
+
+# Prompt size reduction: fewer tokens means lower latency and cost
+_MAX_JD_CHARS = 6000
+_LATEX_COMMENT_LINE_RE = re.compile(r"(?m)^[ \t]*%.*\n?")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_HTML_TAG_RE = re.compile(r"</?[A-Za-z!][^>]*>")
+# Whitespace-only differences between scrapes of the same posting should
+# produce the same prompt (and so the same response cache key)
+_INLINE_SPACE_RE = re.compile(r"[ \t\xa0\u2000-\u200a\u3000]+")
+_LINE_EDGE_SPACE_RE = re.compile(r" *\n *")
+
 
 def _load_env_file() -> None:
     """Load environment variables from .env file if present."""
-    possible_paths = [Path.cwd() / ".env", Path(__file__).parent / ".env"]
+    _load_env_file_from(Path.cwd())
+
+
+@lru_cache(maxsize=4)
+def _load_env_file_from(cwd: Path) -> None:
+    """Parse the .env file visible from ``cwd`` once per process.
+
+    Args:
+        cwd: Working directory to look for a .env file in
+    """
+    possible_paths = [cwd / ".env", Path(__file__).parent / ".env"]
 
     for env_file in possible_paths:
         if env_file.exists():
             logger.debug(f"Loading environment from {env_file}")
-            content = env_file.read_text(encoding="utf-8")
-            for line in content.split("\n"):
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    match = re.match(r"^([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*)$", line)
+            pending: dict[str, str] = {}
+            with env_file.open("r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    # Cheap key check first; existing variables are never overridden
+                    eq = line.find("=")
+                    if eq <= 0:
+                        continue
+                    key = line[:eq].rstrip()
+                    if key in os.environ or key in pending:
+                        continue
+                    match = _ENV_LINE_RE.match(line)
                     if match:
-                        key, value = match.groups()
-                        value = value.strip().strip('"').strip("'")
-                        if key not in os.environ:
-                            os.environ[key] = value
+                        pending[key] = match.group(2).strip().strip('"').strip("'")
+            os.environ.update(pending)
             return
 
 
-def get_api_key() -> str:
-    """Get Groq API key from environment variable or .env file.
+def init() -> str:
+    """Load the .env file and resolve the Groq API key once.
 
     Returns:
         The Groq API key
@@ -47,6 +115,8 @@ def get_api_key() -> str:
     Raises:
         APIKeyError: If the API key is not found
     """
+    global _API_KEY
+
     _load_env_file()
 
     api_key = os.environ.get("GROQ_API_KEY")
@@ -57,11 +127,43 @@ def get_api_key() -> str:
             "1. Create a .env file with: GROQ_API_KEY=your-key-here\n"
             "2. Or set environment variable: export GROQ_API_KEY='your-key'",
         )
+    _API_KEY = api_key
     return api_key
 
 
-def _create_ssl_context() -> ssl.SSLContext:
-    """Create SSL context, handling macOS certificate issues."""
+def set_api_key(api_key: str) -> None:
+    """Replace the API key used for subsequent calls (e.g. after a config update).
+
+    Args:
+        api_key: New Groq API key
+    """
+    global _API_KEY
+
+    os.environ["GROQ_API_KEY"] = api_key
+    _API_KEY = api_key
+
+
+def get_api_key() -> str:
+    """Get Groq API key from environment variable or .env file.
+
+    Returns:
+        The Groq API key
+
+    Raises:
+        APIKeyError: If the API key is not found
+    """
+    return _API_KEY or init()
+
+
+@lru_cache(maxsize=1)
+def _create_ssl_context() -> "ssl.SSLContext":
+    """Create SSL context, handling macOS certificate issues.
+
+    The context (and its parsed CA bundle) is built once and shared by every
+    pooled connection.
+    """
+    import ssl
+
     try:
         import certifi
 
@@ -71,19 +173,206 @@ def _create_ssl_context() -> ssl.SSLContext:
         return ssl.create_default_context()
 
 
+def _new_connection() -> "http.client.HTTPSConnection":
+    """Open a new connection to the Groq API host."""
+    import http.client
+
+    # Concurrent first calls must share one context instead of each building their own
+    with _ssl_lock:
+        context = _create_ssl_context()
+    return http.client.HTTPSConnection(_GROQ_URL.hostname or "", _GROQ_URL.port, timeout=120, context=context)
+
+
+def _get_connection() -> "http.client.HTTPSConnection":
+    """Take a keep-alive connection from the pool, or open a new one."""
+    with _pool_lock:
+        if _pool:
+            return _pool.pop()
+    return _new_connection()
+
+
+def _release_connection(conn: "http.client.HTTPSConnection") -> None:
+    """Return a connection to the pool, closing it if the pool is full."""
+    with _pool_lock:
+        if len(_pool) < _POOL_SIZE:
+            _pool.append(conn)
+            return
+    conn.close()
+
+
+def _close_pool() -> None:
+    """Close every idle pooled connection (registered to run at exit)."""
+    with _pool_lock:
+        conns = _pool[:]
+        _pool.clear()
+    for conn in conns:
+        conn.close()
+
+
+atexit.register(_close_pool)
+
+
+def warm_up(connections: int = 2) -> None:
+    """Open keep-alive connections to the Groq API ahead of the first request.
+
+    Only the TCP and TLS handshakes are done, so no API key or quota is
+    needed; the connections go into the pool for the next calls to reuse.
+    Failures are logged and ignored.
+
+    Args:
+        connections: Number of connections to open (concurrently)
+    """
+
+    def connect(_: int) -> None:
+        conn = _new_connection()
+        try:
+            conn.connect()
+        except OSError as e:
+            logger.debug(f"Groq connection warm-up failed: {e}")
+            conn.close()
+            return
+        _release_connection(conn)
+
+    with ThreadPoolExecutor(max_workers=connections) as ex:
+        list(ex.map(connect, range(connections)))
+
+
+def _read_event_stream(resp: "http.client.HTTPResponse", on_chunk: Callable[[str], None]) -> bytes:
+    """Consume a streamed (server-sent events) chat completion.
+
+    Args:
+        resp: Response whose body is a ``text/event-stream``
+        on_chunk: Called with each piece of generated text as it arrives
+
+    Returns:
+        The complete generated text, UTF-8 encoded
+    """
+    parts: list[str] = []
+    for raw in resp:
+        line = raw.strip()
+        if not line.startswith(b"data:"):
+            continue
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            break
+        event: dict[str, Any] = json_utils.loads(data)
+        if event.get("choices") and (delta := event["choices"][0].get("delta", {}).get("content")):
+            parts.append(delta)
+            on_chunk(delta)
+    resp.read()  # drain the terminating chunk so the connection can be reused
+    return "".join(parts).encode("utf-8")
+
+
+def _send(
+    conn: "http.client.HTTPSConnection",
+    body: bytes,
+    headers: dict[str, str],
+    on_chunk: Callable[[str], None] | None = None,
+) -> tuple[int, bytes, "http.client.HTTPMessage"]:
+    """Send one POST on ``conn`` and return it to the pool if it stays open."""
+    try:
+        conn.request("POST", _GROQ_URL.path, body=body, headers=headers)
+        resp = conn.getresponse()
+        payload = _read_event_stream(resp, on_chunk) if on_chunk is not None and resp.status == 200 else resp.read()
+    except BaseException:
+        conn.close()
+        raise
+
+    if resp.will_close:
+        conn.close()
+    else:
+        _release_connection(conn)
+    return resp.status, payload, resp.headers
+
+
+def _post(
+    body: bytes, headers: dict[str, str], on_chunk: Callable[[str], None] | None = None
+) -> tuple[int, bytes, "http.client.HTTPMessage"]:
+    """POST a request body to the Groq API over a pooled keep-alive connection.
+
+    Args:
+        body: Encoded request body
+        headers: Request headers
+        on_chunk: If given, a successful response is read as an event stream and
+            this is called with each text delta
+
+    Returns:
+        Tuple of (status code, response body, response headers). For a
+        streamed response the body is the concatenated generated text.
+    """
+    conn = _get_connection()
+    reused = conn.sock is not None
+    try:
+        return _send(conn, body, headers, on_chunk)
+    except (ConnectionResetError, BrokenPipeError):
+        # The server may have dropped an idle keep-alive connection; retry once on a fresh one
+        if not reused:
+            raise
+        return _send(_new_connection(), body, headers, on_chunk)
+
+
+@lru_cache(maxsize=1)
+def _rate_limiter() -> rate_limiter.RateLimiter:
+    """Create the process-wide request pacer from GROQ_RPM / GROQ_TPM.
+
+    Returns:
+        Shared rate limiter
+    """
+
+    def limit(name: str, default: int) -> float:
+        try:
+            return float(os.environ.get(name, default))
+        except ValueError:
+            logger.warning(f"Ignoring invalid {name}={os.environ[name]!r}")
+            return default
+
+    rpm, tpm = limit("GROQ_RPM", _DEFAULT_RPM), limit("GROQ_TPM", _DEFAULT_TPM)
+    if rpm > 0 or tpm > 0:
+        logger.info(f"Pacing Groq requests to {rpm:g} requests/min and {tpm:g} tokens/min (0 = unlimited)")
+    return rate_limiter.RateLimiter(rpm, tpm)
+
+
+def _retry_delay(retry_after: str | None, attempt: int) -> float:
+    """Get how long to wait before retrying a failed request.
+
+    Args:
+        retry_after: Value of the Retry-After response header, if any
+        attempt: Zero-based number of the attempt that just failed
+
+    Returns:
+        Delay in seconds
+    """
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), _MAX_RETRY_DELAY)
+        except ValueError:
+            pass  # HTTP-date form; fall back to exponential backoff
+    return min(2**attempt + random.random(), _MAX_RETRY_DELAY)
+
+
 def call_groq_api(
     messages: list[dict[str, str]],
     model: str = DEFAULT_MODEL,
     temperature: float = 0.7,
     max_tokens: int = 4000,
+    use_cache: bool = True,
+    on_chunk: Callable[[str], None] | None = None,
 ) -> str:
     """Call Groq API with given messages.
 
+    Responses are cached on disk by request (see :mod:`cache`), so repeating
+    an identical call returns the stored text without a network round-trip.
+    Set the ``CRACKATS_NO_CACHE=1`` environment variable to bypass the cache.
+
     Args:
         messages: List of dicts with 'role' and 'content' keys
         model: Model to use
         temperature: Sampling temperature (0-2)
         max_tokens: Maximum tokens to generate
+        use_cache: Whether to read and populate the response cache
+        on_chunk: If given, the completion is streamed and this is called with
+            each piece of text as it arrives (once with the whole text on a
+            cache hit)
 
     Returns:
         Generated text content
@@ -94,7 +383,16 @@ def call_groq_api(
         APIRateLimitError: If rate limit is exceeded
         RuntimeError: For other API errors
     """
-    api_key = get_api_key()
+    api_key = _API_KEY or init()
+
+    cache_key = cache.make_key(model, messages, temperature, max_tokens) if use_cache else None
+    cached = cache.get("groq", cache_key) if cache_key else None
+    if cached is not None:
+        logger.info("Using cached Groq API response")
+        content = cached.decode("utf-8")
+        if on_chunk is not None:
+            on_chunk(content)
+        return content
 
     data = {
         "model": model,
@@ -102,52 +400,66 @@ def call_groq_api(
         "temperature": temperature,
         "max_tokens": max_tokens,
     }
+    if on_chunk is not None:
+        data["stream"] = True
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "User-Agent": "CrackATS/1.0",
+    }
 
-    req = urllib.request.Request(
-        GROQ_API_URL,
-        data=json.dumps(data).encode("utf-8"),
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": "CrackATS/1.0",
-        },
-        method="POST",
-    )
-
-    ssl_context = _create_ssl_context()
+    body = json_utils.dumpb(data)
+    # Rough token estimate (~4 characters per token) for the TPM bucket
+    estimated_tokens = sum(len(m.get("content", "")) for m in messages) // 4
+    payload = _post_with_retries(body, headers, on_chunk, estimated_tokens)
 
     try:
-        with urllib.request.urlopen(req, timeout=120, context=ssl_context) as resp:
-            result: dict[str, Any] = json.loads(resp.read().decode("utf-8"))
-            return str(result["choices"][0]["message"]["content"])
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode("utf-8")
-        logger.error(f"Groq API HTTP error {e.code}: {error_body}")
-
-        if e.code == 401:
-            raise APIKeyError(
-                "Invalid API key",
-                details="Your API key is invalid or expired.\n"
-                "1. Check your key at: https://console.groq.com/keys\n"
-                "2. Generate a new key if needed\n"
-                "3. Update: export GROQ_API_KEY='your-new-key'",
-            ) from e
-        elif e.code == 403:
-            raise APIAccessDeniedError(
-                "Access Denied",
-                details="Possible causes:\n"
-                "1. API key revoked or expired\n"
-                "2. Account not verified (check email)\n"
-                "3. Rate limit exceeded\n"
-                "4. IP address blocked",
-            ) from e
-        elif e.code == 429:
-            raise APIRateLimitError(
-                "Rate Limit Exceeded",
-                details="You've made too many requests. Please wait a minute and try again.",
-            ) from e
+        if on_chunk is not None:
+            content = payload.decode("utf-8")
         else:
-            raise RuntimeError(f"Groq API error: {e.code} - {error_body}") from e
+            result: dict[str, Any] = json_utils.loads(payload)
+            content = str(result["choices"][0]["message"]["content"])
+    except Exception as e:
+        raise RuntimeError(f"Failed to call Groq API: {e}") from e
+    if cache_key:
+        cache.put("groq", cache_key, content.encode("utf-8"))
+    return content
+
+
+def _post_with_retries(
+    body: bytes,
+    headers: dict[str, str],
+    on_chunk: Callable[[str], None] | None,
+    estimated_tokens: int,
+) -> bytes:
+    """Send a chat completion request, pacing it and retrying transient failures.
+
+    Args:
+        body: Encoded request body
+        headers: Request headers
+        on_chunk: Streaming callback, passed through to :func:`_post`
+        estimated_tokens: Token estimate charged to the rate limiter per attempt
+
+    Returns:
+        Body of the successful response (the streamed text when ``on_chunk`` is set)
+
+    Raises:
+        APIKeyError: If the API key is invalid
+        APIAccessDeniedError: If access is denied
+        APIRateLimitError: If rate limit is exceeded
+        RuntimeError: For other API and transport errors
+    """
+    import ssl
+
+    try:
+        for attempt in range(_MAX_RETRIES + 1):
+            _rate_limiter().acquire(estimated_tokens)
+            status, payload, response_headers = _post(body, headers, on_chunk)
+            if status not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                break
+            delay = _retry_delay(response_headers.get("Retry-After"), attempt)
+            logger.warning(f"Groq API returned {status}, retrying in {delay:.1f}s ({attempt + 1}/{_MAX_RETRIES})")
+            time.sleep(delay)
     except ssl.SSLError as e:
         raise RuntimeError(
             f"SSL Certificate error: {e}\n\n"
@@ -157,31 +469,68 @@ def call_groq_api(
     except Exception as e:
         raise RuntimeError(f"Failed to call Groq API: {e}") from e
 
+    if status != 200:
+        _raise_for_status(status, payload)
+    return payload
 
-def generate_tailored_resume(
-    job_description: str,
-    master_resume: str,
-    model: str = DEFAULT_MODEL,
-) -> str:
-    """Generate tailored resume based on job description.
+
+def _raise_for_status(status: int, payload: bytes) -> NoReturn:
+    """Raise the exception matching a failed Groq API response.
 
     Args:
-        job_description: Job posting description text
-        master_resume: Master resume LaTeX content
-        model: Model to use
+        status: HTTP status code
+        payload: Response body
 
-    Returns:
-        Tailored resume LaTeX content
+    Raises:
+        APIKeyError: On 401
+        APIAccessDeniedError: On 403
+        APIRateLimitError: On 429
+        RuntimeError: For any other status
     """
-    prompt = f"""You are an expert resume writer specializing in tailoring resumes for specific job descriptions.
+    error_body = payload.decode("utf-8", errors="replace")
+    logger.error(f"Groq API HTTP error {status}: {error_body}")
 
-MASTER RESUME (LaTeX format):
-```latex
-{master_resume}
+    if status == 401:
+        raise APIKeyError(
+            "Invalid API key",
+            details="Your API key is invalid or expired.\n"
+            "1. Check your key at: https://console.groq.com/keys\n"
+            "2. Generate a new key if needed\n"
+            "3. Update: export GROQ_API_KEY='your-new-key'",
+        )
+    elif status == 403:
+        raise APIAccessDeniedError(
+            "Access Denied",
+            details="Possible causes:\n"
+            "1. API key revoked or expired\n"
+            "2. Account not verified (check email)\n"
+            "3. Rate limit exceeded\n"
+            "4. IP address blocked",
+        )
+    elif status == 429:
+        raise APIRateLimitError(
+            "Rate Limit Exceeded",
+            details="You've made too many requests. Please wait a minute and try again.",
+        )
+    else:
+        raise RuntimeError(f"Groq API error: {status} - {error_body}")
+
+
+# Static prompt text, built once at import and filled in per call. Per-user
+# content (the resume) precedes per-job content, so prompts for different
+# postings share a byte-identical prefix that server-side prompt caching can reuse.
+_RESUME_PROMPT_PREFIX = (
+    "You are an expert resume writer specializing in tailoring resumes for specific job descriptions.\n"
+    "\n"
+    "MASTER RESUME (LaTeX format):\n"
+    "```latex\n"
+)
+_RESUME_PROMPT_MID = """
 ```
 
 JOB DESCRIPTION:
-{job_description}
+"""
+_RESUME_PROMPT_SUFFIX = """
 
 TASK:
 Tailor the master resume to align with the job description. Follow these guidelines:
@@ -195,16 +544,228 @@ Tailor the master resume to align with the job description. Follow these guideli
 
 Return ONLY the complete LaTeX resume code, ready to compile."""
 
+# Letter structure and style rules shared by single and packed cover-letter prompts
+_COVER_TASK = (
+    """TASK:
+Write a compelling cover letter following this exact structure:
+
+**Intro:** "Dear Hiring Manager,"
+
+**First paragraph (2 sentences):** 
+- Describe who the applicant is (positions or experiences related to the job, don't mention university)
+- What makes them personable (what they like or believe in)
+- What they want (learning or working on specific topics)
+
+**Second paragraph (3 sentences):**
+- 3 skills that matter for the position
+- For each skill, explain how they use it, give an example, and explain why it was useful
+- Do not enumerate skills (no "1. 2. 3.")
+
+**Third paragraph (2 sentences):**
+- Pick 2 aspects of the company relevant to the applicant
+- Explain why the applicant would be interested to work at this company
+- Do not enumerate aspects
+
+**Last paragraph (use this exact format):**
+"I am confident that my experience aligns with ${company_name}'s needs and hope to further """
+    """discuss how I can contribute to your team's success.
+
+Thank you,
+[Full Name]"
+
+GUIDELINES:
+- Do not use sentence structures with '—' (em dash)
+- Keep the tone professional but personable
+- Be specific about skills and company aspects
+- Make it sound human and authentic, not generic"""
+)
+
+_COVER_PROMPT = string.Template(
+    """You are an expert cover letter writer.
+
+TAILORED RESUME (for context):
+```
+${resume_context}
+```
+
+JOB TITLE: ${job_title}
+COMPANY: ${company_name}
+
+JOB DESCRIPTION:
+${job_description}
+
+"""
+    + _COVER_TASK
+    + """
+
+Return ONLY the cover letter text, no explanations or formatting."""
+)
+
+# Several jobs for the same applicant in one request: the resume context and
+# the instructions are sent once instead of once per letter
+MAX_PACKED_COVER_LETTERS = 4
+_COVER_BATCH_PROMPT = string.Template(
+    """You are an expert cover letter writer. Write one cover letter for each of the ${count} jobs """
+    """below, all for the same applicant.
+
+APPLICANT RESUME (for context):
+```
+${resume_context}
+```
+
+${jobs}
+
+For EACH job, """
+    + string.Template(_COVER_TASK).safe_substitute(company_name="{COMPANY}")
+    + """
+- Replace {COMPANY} with the COMPANY of the job the letter is for
+
+Return ONLY a JSON object of the form {"letters": ["<letter for JOB 1>", "<letter for JOB 2>", ...]} """
+    """with exactly ${count} strings in job order, no explanations or markdown."""
+)
+
+
+def _safe_truncate(text: str, limit: int) -> str:
+    r"""Cut text to at most ``limit`` characters at a clean boundary.
+
+    Prefers the last paragraph break or ``\section`` heading inside the limit,
+    then the last line break, so LaTeX commands are not split mid-way. Falls
+    back to a hard cut when no boundary lies in the second half of the window.
+
+    Args:
+        text: Text to truncate
+        limit: Maximum length
+
+    Returns:
+        Truncated text
+    """
+    if len(text) <= limit:
+        return text
+    cut = max(text.rfind("\n\n", 0, limit), text.rfind("\\section", 0, limit))
+    if cut <= limit // 2:
+        cut = text.rfind("\n", 0, limit)
+    return text[: cut if cut > limit // 2 else limit]
+
+
+def _compact_latex(latex: str) -> str:
+    """Drop full-line LaTeX comments and collapse runs of blank lines.
+
+    Args:
+        latex: LaTeX source
+
+    Returns:
+        Compacted LaTeX source
+    """
+    return _BLANK_LINES_RE.sub("\n\n", _LATEX_COMMENT_LINE_RE.sub("", latex))
+
+
+def _compact_jd(job_description: str) -> str:
+    """Strip leftover HTML tags and redundant whitespace from a job description.
+
+    Runs of spaces, tabs and Unicode spaces become one space and line edges
+    are trimmed, so re-scraping a posting whose only changes are whitespace
+    hits the response cache instead of calling the API again.
+
+    Args:
+        job_description: Job posting description text
+
+    Returns:
+        Compacted job description, capped in length
+    """
+    text = _INLINE_SPACE_RE.sub(" ", _HTML_TAG_RE.sub("", job_description))
+    text = _BLANK_LINES_RE.sub("\n\n", _LINE_EDGE_SPACE_RE.sub("\n", text)).strip()
+    return _safe_truncate(text, _MAX_JD_CHARS)
+
+
+async def call_groq_api_async(
+    messages: list[dict[str, str]],
+    model: str = DEFAULT_MODEL,
+    temperature: float = 0.7,
+    max_tokens: int = 4000,
+    use_cache: bool = True,
+) -> str:
+    """Awaitable variant of :func:`call_groq_api` for use inside an event loop.
+
+    The blocking request runs in a worker thread on the shared connection pool,
+    so several calls can be awaited together with ``asyncio.gather``.
+
+    Args:
+        messages: List of dicts with 'role' and 'content' keys
+        model: Model to use
+        temperature: Sampling temperature (0-2)
+        max_tokens: Maximum tokens to generate
+        use_cache: Whether to read and populate the response cache
+
+    Returns:
+        Generated text content
+    """
+    import asyncio
+
+    return await asyncio.to_thread(call_groq_api, messages, model, temperature, max_tokens, use_cache)
+
+
+def _complete(
+    system: str,
+    prompt: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    on_chunk: Callable[[str], None] | None = None,
+) -> str:
+    """Send a single system + user prompt pair to the Groq API.
+
+    Args:
+        system: System message content
+        prompt: User message content
+        model: Model to use
+        temperature: Sampling temperature (0-2)
+        max_tokens: Maximum tokens to generate
+        on_chunk: Optional callback to stream the completion to
+
+    Returns:
+        Generated text content
+    """
     messages = [
-        {
-            "role": "system",
-            "content": "You are an expert resume writer. Return only valid LaTeX code without any explanations or markdown formatting.",
-        },
+        {"role": "system", "content": system},
         {"role": "user", "content": prompt},
     ]
+    return call_groq_api(messages, model=model, temperature=temperature, max_tokens=max_tokens, on_chunk=on_chunk)
+
+
+def generate_tailored_resume(
+    job_description: str,
+    master_resume: str,
+    model: str = DEFAULT_MODEL,
+    on_chunk: Callable[[str], None] | None = None,
+) -> str:
+    """Generate tailored resume based on job description.
+
+    Args:
+        job_description: Job posting description text
+        master_resume: Master resume LaTeX content
+        model: Model to use
+        on_chunk: Optional callback receiving the resume as it streams in
+
+    Returns:
+        Tailored resume LaTeX content
+    """
+    master_resume = _compact_latex(master_resume)
+    job_description = _compact_jd(job_description)
+
+    prompt = "".join(
+        [_RESUME_PROMPT_PREFIX, master_resume, _RESUME_PROMPT_MID, job_description, _RESUME_PROMPT_SUFFIX]
+    )
 
     logger.info(f"Generating tailored resume using model: {model}")
-    return call_groq_api(messages, model=model, temperature=0.7, max_tokens=4000)
+    return _complete(
+        "You are an expert resume writer. "
+        "Return only valid LaTeX code without any explanations or markdown formatting.",
+        prompt,
+        model=model,
+        temperature=0.7,
+        max_tokens=4000,
+        on_chunk=on_chunk,
+    )
 
 
 def generate_cover_letter(
@@ -213,6 +774,7 @@ def generate_cover_letter(
     company_name: str,
     job_title: str,
     model: str = DEFAULT_MODEL,
+    on_chunk: Callable[[str], None] | None = None,
 ) -> str:
     """Generate cover letter based on job description and tailored resume.
 
@@ -222,67 +784,167 @@ def generate_cover_letter(
         company_name: Company name
         job_title: Job title
         model: Model to use
+        on_chunk: Optional callback receiving the letter as it streams in
 
     Returns:
         Cover letter text
     """
-    prompt = f"""You are an expert cover letter writer.
+    job_description = _compact_jd(job_description)
 
-JOB TITLE: {job_title}
-COMPANY: {company_name}
+    prompt = _COVER_PROMPT.substitute(
+        job_title=job_title,
+        company_name=company_name,
+        job_description=job_description,
+        resume_context=_safe_truncate(tailored_resume, 2000),
+    )
 
-JOB DESCRIPTION:
-{job_description}
+    logger.info(f"Generating cover letter using model: {model}")
+    return _complete(
+        "You are an expert cover letter writer. "
+        "Return only the cover letter text without any explanations or markdown formatting.",
+        prompt,
+        model=model,
+        temperature=0.8,
+        max_tokens=2000,
+        on_chunk=on_chunk,
+    )
 
-TAILORED RESUME (for context):
-```
-{tailored_resume[:2000]}
-```
 
-TASK:
-Write a compelling cover letter following this exact structure:
+def generate_cover_letters(
+    jobs: list[dict[str, str]],
+    master_resume: str,
+    model: str = DEFAULT_MODEL,
+) -> list[str | None]:
+    """Generate cover letters for several jobs with one API request.
 
-**Intro:** "Dear Hiring Manager,"
+    The shared resume context and letter instructions are sent once, which
+    cuts request count and prompt tokens under Groq's per-minute limits. At
+    most ``MAX_PACKED_COVER_LETTERS`` jobs fit in one response.
 
-**First paragraph (2 sentences):** 
-- Describe who the applicant is (positions or experiences related to the job, don't mention university)
-- What makes them personable (what they like or believe in)
-- What they want (learning or working on specific topics)
+    Args:
+        jobs: Job dicts with title, company and description
+        master_resume: Master resume content shared by all jobs (for context)
+        model: Model to use
 
-**Second paragraph (3 sentences):**
-- 3 skills that matter for the position
-- For each skill, explain how they use it, give an example, and explain why it was useful
-- Do not enumerate skills (no "1. 2. 3.")
+    Returns:
+        One cover letter per job, in order; None where the response could not
+        be split, so the caller can fall back to :func:`generate_cover_letter`
 
-**Third paragraph (2 sentences):**
-- Pick 2 aspects of the company relevant to the applicant
-- Explain why the applicant would be interested to work at this company
-- Do not enumerate aspects
+    Raises:
+        ValueError: If more jobs are given than fit in one request
+    """
+    if len(jobs) > MAX_PACKED_COVER_LETTERS:
+        raise ValueError(f"At most {MAX_PACKED_COVER_LETTERS} cover letters can be packed into one request")
 
-**Last paragraph (use this exact format):**
-"I am confident that my experience aligns with {company_name}'s needs and hope to further discuss how I can contribute to your team's success.
+    listing = "\n\n".join(
+        f"JOB {i}:\nJOB TITLE: {job['title']}\nCOMPANY: {job['company']}\n"
+        f"JOB DESCRIPTION:\n{_compact_jd(job['description'])}"
+        for i, job in enumerate(jobs, 1)
+    )
+    prompt = _COVER_BATCH_PROMPT.substitute(
+        count=len(jobs),
+        resume_context=_safe_truncate(master_resume, 2000),
+        jobs=listing,
+    )
 
-Thank you,
-[Full Name]"
+    logger.info(f"Generating {len(jobs)} cover letters in one request using model: {model}")
+    response = _complete(
+        "You are an expert cover letter writer. "
+        "Return only a JSON object without any explanations or markdown formatting.",
+        prompt,
+        model=model,
+        temperature=0.8,
+        max_tokens=1200 * len(jobs),
+    )
 
-GUIDELINES:
-- Do not use sentence structures with '—' (em dash)
-- Keep the tone professional but personable
-- Be specific about skills and company aspects
-- Make it sound human and authentic, not generic
+    try:
+        data = json_utils.loads(strip_code_fences(response))
+    except ValueError:
+        logger.warning("Packed cover letter response was not valid JSON")
+        return [None] * len(jobs)
+    letters = data.get("letters") if isinstance(data, dict) else data
+    if not isinstance(letters, list) or len(letters) != len(jobs):
+        logger.warning("Packed cover letter response did not contain one letter per job")
+        return [None] * len(jobs)
+    return [letter.strip() if isinstance(letter, str) and letter.strip() else None for letter in letters]
+
+
+def generate_resume_and_cover_letter(
+    job_description: str,
+    master_resume: str,
+    company_name: str,
+    job_title: str,
+    model: str = DEFAULT_MODEL,
+) -> tuple[str, str]:
+    """Generate a tailored resume and a cover letter with concurrent API calls.
 
-Return ONLY the cover letter text, no explanations or formatting."""
+    Both requests are in flight at the same time, so the wall-clock cost is
+    that of the slower call rather than the sum of both. The cover letter is
+    written against the master resume, since the tailored one is not yet
+    available when it is requested.
 
-    messages = [
-        {
-            "role": "system",
-            "content": "You are an expert cover letter writer. Return only the cover letter text without any explanations or markdown formatting.",
-        },
-        {"role": "user", "content": prompt},
-    ]
+    Args:
+        job_description: Job posting description text
+        master_resume: Master resume LaTeX content
+        company_name: Company name
+        job_title: Job title
+        model: Model to use
 
-    logger.info(f"Generating cover letter using model: {model}")
-    return call_groq_api(messages, model=model, temperature=0.8, max_tokens=2000)
+    Returns:
+        Tuple of (tailored resume LaTeX content, cover letter text)
+    """
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        resume = ex.submit(generate_tailored_resume, job_description, master_resume, model)
+        cover_letter = ex.submit(
+            generate_cover_letter, job_description, master_resume, company_name, job_title, model
+        )
+        return resume.result(), cover_letter.result()
+
+
+async def generate_resume_and_cover_letter_async(
+    job_description: str,
+    master_resume: str,
+    company_name: str,
+    job_title: str,
+    model: str = DEFAULT_MODEL,
+) -> tuple[str, str]:
+    """Awaitable variant of :func:`generate_resume_and_cover_letter`.
+
+    Args:
+        job_description: Job posting description text
+        master_resume: Master resume LaTeX content
+        company_name: Company name
+        job_title: Job title
+        model: Model to use
+
+    Returns:
+        Tuple of (tailored resume LaTeX content, cover letter text)
+    """
+    import asyncio
+
+    resume, cover_letter = await asyncio.gather(
+        asyncio.to_thread(generate_tailored_resume, job_description, master_resume, model),
+        asyncio.to_thread(generate_cover_letter, job_description, master_resume, company_name, job_title, model),
+    )
+    return resume, cover_letter
+
+
+def strip_code_fences(text: str) -> str:
+    """Remove a surrounding markdown code fence from a model response.
+
+    Args:
+        text: Model response
+
+    Returns:
+        Response without the fence and surrounding whitespace
+    """
+    text = text.strip()
+    # Anchored match + endswith only look at the ends instead of scanning the whole response
+    if opening := _FENCE_OPEN_RE.match(text):
+        text = text[opening.end() :]
+    if text.endswith("```"):
+        text = text[:-3]
+    return text.strip()
 
 
 def extract_resume_sections(latex_content: str) -> dict[str, str]:
@@ -296,31 +958,22 @@ def extract_resume_sections(latex_content: str) -> dict[str, str]:
     """
     sections: dict[str, str] = {"skills": "", "experience": "", "education": ""}
 
-    lines = latex_content.split("\n")
-    current_section: str | None = None
-    section_buffer: list[str] = []
-
-    for line in lines:
-        line = line.strip()
-        if "\\section{" in line.lower() or "\\section*{" in line.lower():
-            if current_section and section_buffer:
-                sections[current_section] = "\n".join(section_buffer)
-            section_buffer = []
-
-            lower_line = line.lower()
-            if "skill" in lower_line:
-                current_section = "skills"
-            elif "experience" in lower_line or "work" in lower_line:
-                current_section = "experience"
-            elif "education" in lower_line:
-                current_section = "education"
-            else:
-                current_section = None
-        elif current_section:
-            section_buffer.append(line)
-
-    if current_section and section_buffer:
-        sections[current_section] = "\n".join(section_buffer)
+    matches = list(_SECTION_RE.finditer(latex_content))
+    for i, match in enumerate(matches):
+        title = match.group(1).lower()
+        if "skill" in title:
+            key = "skills"
+        elif "experience" in title or "work" in title:
+            key = "experience"
+        elif "education" in title:
+            key = "education"
+        else:
+            continue
+
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(latex_content)
+        body = latex_content[match.end() : end].strip()
+        if body:
+            sections[key] = body
 
     return sections
 
@@ -332,7 +985,9 @@ def test_api_key() -> bool:
             {"role": "system", "content": "You are a helpful assistant."},
             {"role": "user", "content": "Say 'API key is working!' if you receive this message."},
         ]
-        result = call_groq_api(messages, model="llama-3.1-8b-instant", max_tokens=50)
+        result = call_groq_api(
+            messages, model="llama-3.1-8b-instant", max_tokens=50, use_cache=False
+        )
         logger.info(f"API Key Test: {result}")
         return True
     except Exception as e:
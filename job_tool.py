@@ -2,28 +2,97 @@
 """CLI for job application workflow: scrape → template setup → AI generation."""
 
 import argparse
-import json
+import contextlib
 import logging
+import logging.handlers
+import os
+import re
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
-import processor
-import scraper
+import cache
+import json_utils
 from exceptions import APIKeyError, CrackATSException, ValidationError
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore[assignment]
+
+
+class _BatchedStderrHandler(logging.handlers.MemoryHandler):
+    """Buffer log records and write each batch to stderr with a single call.
+
+    A batch is written when the buffer fills, when a WARNING or worse is
+    logged, on :func:`_flush_logs`, and at interpreter exit.
+    """
+
+    def __init__(self, capacity: int = 32) -> None:
+        super().__init__(capacity, flushLevel=logging.WARNING)
+
+    def flush(self) -> None:
+        with self.lock or contextlib.nullcontext():
+            if not self.buffer:
+                return
+            text = "".join(f"{self.format(record)}\n" for record in self.buffer)
+            self.buffer.clear()
+            try:
+                sys.stderr.write(text)
+                sys.stderr.flush()
+            except (OSError, ValueError):
+                pass
+
+
+_log_handler = _BatchedStderrHandler()
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[_log_handler],
 )
 logger = logging.getLogger(__name__)
 
 
+def _flush_logs() -> None:
+    """Write buffered progress messages now, e.g. before a long wait or a prompt."""
+    _log_handler.flush()
+
+
+_REQUIRED_JOB_FIELDS = ("title", "company", "description")
+
+# Horizontal rule framing CLI banners
+_HR = "=" * 60
+
+if msgspec is not None:
+
+    class _JobPayload(msgspec.Struct):
+        """Bookmarklet job payload, decoded and type-checked by msgspec."""
+
+        title: str
+        company: str
+        description: str
+        url: str | None = None
+
+# Structured "Title: ..." / "Company: ..." header lines of a job description file
+_HEADER_RE = re.compile(r"^(Title|Company): (.*)$", re.MULTILINE)
+
+# Text files in a job folder that are not the job description
+_NON_JD_FILES = frozenset({"prompt.txt", "prompt-cover.txt", "Cover_Letter.txt"})
+
+
 def _load_json_job(json_path: str | Path) -> dict[str, Any]:
     """Load job data from JSON file (from bookmarklet).
 
+    Decoding and type validation happen in one pass with msgspec when it is
+    installed; otherwise the bytes go straight to orjson (or the stdlib
+    parser) and equivalent checks are used.
+
     Args:
         json_path: Path to JSON file
 
@@ -31,16 +100,43 @@ def _load_json_job(json_path: str | Path) -> dict[str, Any]:
         Job data dictionary
 
     Raises:
-        ValidationError: If JSON is missing required fields
+        ValidationError: If the JSON is malformed or required fields are missing or not strings
     """
-    data: dict[str, Any] = json.loads(Path(json_path).read_text(encoding="utf-8"))
-    required = ["title", "company", "description"]
-    missing = [f for f in required if not data.get(f)]
+    raw = Path(json_path).read_bytes()
+    if msgspec is not None:
+        try:
+            data: dict[str, Any] = msgspec.structs.asdict(msgspec.json.decode(raw, type=_JobPayload))
+        except msgspec.ValidationError as e:
+            raise ValidationError(f"Invalid job JSON: {e}") from e
+        except msgspec.DecodeError as e:
+            raise ValidationError(f"Malformed job JSON: {e}") from e
+    else:
+        try:
+            data = json_utils.loads(raw)
+        except ValueError as e:
+            raise ValidationError(f"Malformed job JSON: {e}") from e
+        if not isinstance(data, dict):
+            raise ValidationError("Invalid job JSON: expected an object")
+        for field in _REQUIRED_JOB_FIELDS:
+            if field in data and not isinstance(data[field], str):
+                raise ValidationError(f"Invalid job JSON: Expected `str` for `{field}`")
+
+    missing = [f for f in _REQUIRED_JOB_FIELDS if not (data.get(f) or "").strip()]
     if missing:
         raise ValidationError(f"JSON missing fields: {', '.join(missing)}")
     return data
 
 
+@lru_cache(maxsize=1)
+def _code_binary() -> str | None:
+    """Locate the VS Code launcher on PATH once per process.
+
+    Returns:
+        Absolute path to ``code`` (or ``code.cmd``), or None if not installed
+    """
+    return shutil.which("code") or shutil.which("code.cmd")
+
+
 def _open_in_vscode(path: str | Path) -> bool:
     """Open folder in VS Code if available.
 
@@ -50,14 +146,27 @@ def _open_in_vscode(path: str | Path) -> bool:
     Returns:
         True if VS Code was opened, False otherwise
     """
-    code = shutil.which("code") or shutil.which("code.cmd")
+    code = _code_binary()
     if code:
         try:
-            subprocess.Popen(
-                [code, str(path)],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
+            if hasattr(os, "posix_spawn"):
+                # Spawn without forking this process; output goes to /dev/null
+                os.posix_spawn(
+                    code,
+                    [code, str(path)],
+                    os.environ,
+                    file_actions=[
+                        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                        (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+                    ],
+                    setsid=True,
+                )
+            else:
+                subprocess.Popen(
+                    [code, str(path)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
             return True
         except OSError:
             pass
@@ -68,81 +177,34 @@ def _generate_ai_content(
     job_data: dict[str, Any],
     folder_path: str | Path,
     model: str = "llama-3.3-70b-versatile",
-) -> dict[str, Path]:
+    with_cover_letter: bool = True,
+) -> dict[str, Any]:
     """Generate tailored resume and cover letter using Groq API.
 
     Args:
         job_data: Job data dict with title, company, description
         folder_path: Path to job folder containing resume-template.tex
         model: Groq model to use
+        with_cover_letter: Also write Cover_Letter.txt (False when it was
+            already generated, e.g. in a packed batch request)
 
     Returns:
-        Dict with paths to generated files
+        Result of :func:`ai_generation.generate` (generated texts and paths)
 
     Raises:
         FileNotFoundError: If master resume not found
         APIKeyError: If API key is missing or invalid
     """
-    try:
-        import groq_client
-    except ImportError as e:
-        raise RuntimeError("groq_client module not found.") from e
-
-    folder = Path(folder_path)
-
-    master_resume_path = folder / "resume-template.tex"
-    if not master_resume_path.exists():
-        raise FileNotFoundError(f"Master resume not found: {master_resume_path}")
-
-    master_resume = master_resume_path.read_text(encoding="utf-8")
+    import ai_generation
 
     logger.info("Generating AI-tailored content...")
     logger.info("This may take 30-60 seconds...")
-
     logger.info("Tailoring resume to job description...")
-    tailored_resume = groq_client.generate_tailored_resume(
-        job_description=job_data["description"],
-        master_resume=master_resume,
-        model=model,
-    )
+    if with_cover_letter:
+        logger.info("Writing cover letter...")
+    _flush_logs()
 
-    # Clean up the response (remove markdown code blocks if present)
-    if tailored_resume.startswith("```latex"):
-        tailored_resume = tailored_resume[8:]
-    if tailored_resume.startswith("```"):
-        tailored_resume = tailored_resume[3:]
-    if tailored_resume.endswith("```"):
-        tailored_resume = tailored_resume[:-3]
-    tailored_resume = tailored_resume.strip()
-
-    tailored_resume_path = folder / "Resume.tex"
-    tailored_resume_path.write_text(tailored_resume, encoding="utf-8")
-    logger.info(f"Resume.tex generated: {tailored_resume_path}")
-
-    logger.info("Writing cover letter...")
-    cover_letter = groq_client.generate_cover_letter(
-        job_description=job_data["description"],
-        tailored_resume=tailored_resume,
-        company_name=job_data["company"],
-        job_title=job_data["title"],
-        model=model,
-    )
-
-    # Clean up the response
-    if cover_letter.startswith("```"):
-        cover_letter = cover_letter[3:]
-    if cover_letter.endswith("```"):
-        cover_letter = cover_letter[:-3]
-    cover_letter = cover_letter.strip()
-
-    cover_letter_path = folder / "Cover_Letter.txt"
-    cover_letter_path.write_text(cover_letter, encoding="utf-8")
-    logger.info(f"Cover_Letter.txt generated: {cover_letter_path}")
-
-    return {
-        "tailored_resume_path": tailored_resume_path,
-        "cover_letter_path": cover_letter_path,
-    }
+    return ai_generation.generate(job_data, folder_path, model=model, with_cover_letter=with_cover_letter)
 
 
 def _cleanup_templates(folder_path: str | Path) -> list[str]:
@@ -154,59 +216,124 @@ def _cleanup_templates(folder_path: str | Path) -> list[str]:
     Returns:
         List of removed filenames
     """
-    folder = Path(folder_path)
-    files_to_remove = ["prompt.txt", "prompt-cover.txt", "resume-template.tex"]
-
-    removed: list[str] = []
-    for filename in files_to_remove:
-        file_path = folder / filename
-        if file_path.exists():
-            try:
-                file_path.unlink()
-                removed.append(filename)
-                logger.debug(f"Cleaned up: {filename}")
-            except OSError as e:
-                logger.warning(f"Failed to remove {filename}: {e}")
+    import ai_generation
 
-    return removed
+    return ai_generation.cleanup_templates(folder_path)
 
 
-def scrape_job(args: argparse.Namespace) -> dict[str, Any]:
-    """Step 1: Scrape job and create folder with templates.
+def _report_success(gen_result: dict[str, Any], tip: bool = False) -> None:
+    """Log the banner shown after AI content was generated.
 
     Args:
-        args: Command line arguments
+        gen_result: Result of ``_generate_ai_content``
+        tip: Also remind the user to review the files
+    """
+    logger.info(_HR)
+    logger.info("AI generation complete!")
+    logger.info(_HR)
+    logger.info(f"Resume (LaTeX): {gen_result['tailored_resume_path']}")
+    logger.info("  → Copy to Overleaf to generate PDF")
+    logger.info(f"Cover Letter: {gen_result['cover_letter_path']}")
+    logger.info("  → Ready to use!")
+    if tip:
+        logger.info("\nTip: Review both files before submitting")
+    logger.info(_HR)
 
-    Returns:
-        Processing result dictionary
+
+def _report_api_key_error(folder_path: str | Path | None = None) -> None:
+    """Log setup instructions for a missing or invalid Groq API key.
+
+    Args:
+        folder_path: Template folder that was already created, if any
     """
-    target = (args.url or "").strip()
-    if not target:
-        try:
-            target = input("Job posting URL or JSON file: ").strip()
-        except EOFError:
-            pass
+    logger.error(_HR)
+    logger.error("GROQ_API_KEY not found!")
+    logger.error(_HR)
+    logger.error("\nTo use AI generation, add your API key to .env file:")
+    logger.error("1. Get API key: https://console.groq.com/keys")
+    logger.error("2. Create .env file:")
+    logger.error('   echo "GROQ_API_KEY=your-key-here" > .env')
+    logger.error("\nOr set environment variable:")
+    logger.error('   export GROQ_API_KEY="your-key-here"')
+    if folder_path is not None:
+        logger.error("\nTemplate folder created. Run generate command later:")
+        logger.error(f"   python3 job_tool.py generate {folder_path}")
+    logger.error(_HR)
+
+
+def _load_target(target: str) -> dict[str, Any]:
+    """Load job data from a bookmarklet JSON file or scrape it from a URL.
 
-    if not target:
-        logger.error("Error: URL or JSON file path required.")
-        sys.exit(1)
+    Args:
+        target: Job posting URL, saved HTML path or JSON file path
 
+    Returns:
+        Job data dictionary
+    """
     # JSON file (from bookmarklet) → load directly
     if target.lower().endswith(".json") and not target.lower().startswith(("http://", "https://")):
-        try:
-            job = _load_json_job(target)
-        except Exception as e:
-            logger.error(f"Error: {e}")
-            sys.exit(1)
-    else:
-        # URL → scrape and process
-        logger.info("Scraping job posting...")
-        job = scraper.scrape_job(target)
+        return _load_json_job(target)
+    # URL → scrape and process (recent results are served from the cache)
+    is_url = target.lower().startswith(("http://", "https://"))
+    key = cache.make_key(target)
+    if is_url and (cached := cache.get("scrape", key)) is not None:
+        logger.info(f"Using cached job posting: {target}")
+        job: dict[str, Any] = json_utils.loads(cached)
+        return job
+
+    import scraper
+
+    logger.info(f"Scraping job posting: {target}")
+    # The scrape can take seconds with the curl/Playwright fallbacks
+    _flush_logs()
+    job = scraper.scrape_job(target)
+    if is_url and job.get("title") and job.get("description"):
+        cache.put("scrape", key, json_utils.dumpb(job))
+    return job
 
+
+async def _scrape_all(targets: list[str], max_concurrency: int = 5) -> list[dict[str, Any] | BaseException]:
+    """Load several job postings concurrently.
+
+    Args:
+        targets: Job posting URLs or file paths
+        max_concurrency: Maximum number of postings fetched at once
+
+    Returns:
+        Job data dict or raised exception for each target, in input order
+    """
+    import asyncio
+
+    sem = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _scrape_one(target: str) -> dict[str, Any]:
+        async with sem:
+            return await asyncio.to_thread(_load_target, target)
+
+    return await asyncio.gather(*(_scrape_one(t) for t in targets), return_exceptions=True)
+
+
+def _process_scraped(job: dict[str, Any], target: str, args: argparse.Namespace) -> dict[str, Any]:
+    """Create the job folder for scraped data and optionally generate AI content.
+
+    Args:
+        job: Job data dictionary
+        target: URL or file path the job was loaded from
+        args: Command line arguments
+
+    Returns:
+        Processing result dictionary
+
+    Raises:
+        ValidationError: If the job data has no title or description
+    """
     # Validate job data has meaningful content
     if not job.get("title") or not job.get("description"):
-        logger.error("Error: Failed to extract job data. The job posting may be blocked or no longer available.")
-        sys.exit(1)
+        raise ValidationError(
+            "Failed to extract job data. The job posting may be blocked or no longer available."
+        )
+
+    import processor
 
     logger.info(f"Found: {job.get('title')} at {job.get('company')}")
 
@@ -230,50 +357,128 @@ def scrape_job(args: argparse.Namespace) -> dict[str, Any]:
                 if removed:
                     logger.info(f"Cleaned up {len(removed)} template files: {', '.join(removed)}")
 
-            logger.info("=" * 60)
-            logger.info("AI generation complete!")
-            logger.info("=" * 60)
-            logger.info(f"Resume (LaTeX): {gen_result['tailored_resume_path']}")
-            logger.info("  → Copy to Overleaf to generate PDF")
-            logger.info(f"Cover Letter: {gen_result['cover_letter_path']}")
-            logger.info("  → Ready to use!")
-            logger.info("=" * 60)
-
-        except APIKeyError as e:
-            logger.error("=" * 60)
-            logger.error("GROQ_API_KEY not found!")
-            logger.error("=" * 60)
-            logger.error("\nTo use AI generation, add your API key to .env file:")
-            logger.error("1. Get API key: https://console.groq.com/keys")
-            logger.error("2. Create .env file:")
-            logger.error('   echo "GROQ_API_KEY=your-key-here" > .env')
-            logger.error("\nOr set environment variable:")
-            logger.error('   export GROQ_API_KEY="your-key-here"')
-            logger.error("\nTemplate folder created. Run generate command later:")
-            logger.error(f"   python3 job_tool.py generate {result['folder_path']}")
-            logger.error("=" * 60)
+            _report_success(gen_result)
+
+        except APIKeyError:
+            _report_api_key_error(result["folder_path"])
         except Exception as e:
             logger.error(f"AI generation failed: {e}")
             logger.error(f"\nTemplate folder created. You can retry later:")
             logger.error(f"   python3 job_tool.py generate {result['folder_path']}")
     else:
-        logger.info("=" * 60)
+        logger.info(_HR)
         logger.info("Step 1 Complete: Job scraped and folder created!")
-        logger.info("=" * 60)
+        logger.info(_HR)
         logger.info("\nNext steps:")
         logger.info("1. Review the job description and prompts in the folder")
         logger.info("2. Run AI generation when ready:")
         logger.info(f"   python3 job_tool.py generate {result['folder_path']}")
         logger.info("\nOr generate immediately with --generate flag:")
         logger.info(f'   python3 job_tool.py scrape "{target}" --generate')
-        logger.info("=" * 60)
-
-    if _open_in_vscode(result["folder_path"]):
-        logger.info("Opened folder in VS Code")
+        logger.info(_HR)
 
     return result
 
 
+def scrape_job(args: argparse.Namespace) -> list[dict[str, Any]]:
+    """Step 1: Scrape one or more jobs and create folders with templates.
+
+    Several targets are fetched concurrently; a failure on one of them is
+    logged and does not abort the rest of the batch.
+
+    Args:
+        args: Command line arguments
+
+    Returns:
+        Processing result dictionaries for the jobs that succeeded
+    """
+    targets = [t.strip() for t in (args.url or []) if t.strip()]
+    if not targets:
+        try:
+            _flush_logs()
+            target = input("Job posting URL or JSON file: ").strip()
+        except EOFError:
+            target = ""
+        if target:
+            targets = [target]
+
+    if not targets:
+        logger.error("Error: URL or JSON file path required.")
+        sys.exit(1)
+
+    if len(targets) == 1:
+        try:
+            result = _process_scraped(_load_target(targets[0]), targets[0], args)
+        except (CrackATSException, OSError, ValueError) as e:
+            logger.error(f"Error: {e}")
+            sys.exit(1)
+        if _open_in_vscode(result["folder_path"]):
+            logger.info("Opened folder in VS Code")
+        return [result]
+
+    import asyncio
+
+    logger.info(f"Scraping {len(targets)} job postings...")
+    _flush_logs()
+    jobs = asyncio.run(_scrape_all(targets, getattr(args, "max_concurrency", 5)))
+
+    results: list[dict[str, Any]] = []
+    for target, job in zip(targets, jobs):
+        try:
+            if isinstance(job, BaseException):
+                raise job
+            results.append(_process_scraped(job, target, args))
+        except Exception as e:
+            logger.error(f"Error: {target}: {e}")
+
+    logger.info(f"Created {len(results)} of {len(targets)} job folders")
+    if not results:
+        sys.exit(1)
+    return results
+
+
+def _find_job_description(folder_path: Path) -> Path | None:
+    """Find the job description file in a job folder.
+
+    Args:
+        folder_path: Job folder created by the scrape command
+
+    Returns:
+        Path to the job description, or None if there is none
+    """
+    with os.scandir(folder_path) as it:
+        for entry in it:
+            name = entry.name
+            if name.endswith(".txt") and not name.startswith(".") and name not in _NON_JD_FILES and entry.is_file():
+                return Path(entry.path)
+    return None
+
+
+def _read_job_data(folder_path: Path, job_desc_file: Path) -> dict[str, Any]:
+    """Build job data from a job description file.
+
+    Args:
+        folder_path: Job folder (its name is the fallback title)
+        job_desc_file: Job description file in the folder
+
+    Returns:
+        Job data dict with title, company, description
+    """
+    # Only the first lines can hold the structured header; read them on their own
+    with job_desc_file.open("r", encoding="utf-8") as fh:
+        head = "".join(islice(fh, 10))
+        content = head + fh.read()
+
+    # Parse the structured header in one pass; later lines win, as before
+    header = {m.group(1): m.group(2).strip() for m in _HEADER_RE.finditer(head)}
+
+    return {
+        "title": header.get("Title", folder_path.name.replace("-", " ")),
+        "company": header.get("Company", "Unknown"),
+        "description": content,
+    }
+
+
 def generate_content(args: argparse.Namespace) -> None:
     """Step 2: Generate AI content for existing job folder.
 
@@ -299,13 +504,7 @@ def generate_content(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     # Find job description file
-    txt_files = list(folder_path.glob("*.txt"))
-    job_desc_file: Path | None = None
-    for f in txt_files:
-        if f.name not in ["prompt.txt", "prompt-cover.txt", "Cover_Letter.txt"]:
-            job_desc_file = f
-            break
-
+    job_desc_file = _find_job_description(folder_path)
     if not job_desc_file:
         logger.error(f"Error: Job description file not found in {folder_path}")
         logger.error("Expected a .txt file with job description (not prompt.txt or Cover_Letter.txt)")
@@ -313,26 +512,10 @@ def generate_content(args: argparse.Namespace) -> None:
         logger.error(f'   python3 job_tool.py scrape "https://linkedin.com/jobs/view/123"')
         sys.exit(1)
 
-    # Parse job description file
-    content = job_desc_file.read_text(encoding="utf-8")
-    lines = content.split("\n")
-
-    # Extract title and company from first few lines
-    job_title = folder_path.name.replace("-", " ")
-    company = "Unknown"
-    description = content
-
-    # Try to parse structured format
-    for line in lines[:10]:
-        if line.startswith("Title: "):
-            job_title = line[7:].strip()
-        elif line.startswith("Company: "):
-            company = line[9:].strip()
-
-    job_data = {"title": job_title, "company": company, "description": description}
+    job_data = _read_job_data(folder_path, job_desc_file)
 
     logger.info(f"Processing folder: {folder_path.name}")
-    logger.info(f"Job: {job_title} at {company}")
+    logger.info(f"Job: {job_data['title']} at {job_data['company']}")
 
     try:
         gen_result = _generate_ai_content(job_data, folder_path, model=args.model)
@@ -343,36 +526,172 @@ def generate_content(args: argparse.Namespace) -> None:
             if removed:
                 logger.info(f"Cleaned up {len(removed)} template files: {', '.join(removed)}")
 
-        logger.info("=" * 60)
-        logger.info("AI generation complete!")
-        logger.info("=" * 60)
-        logger.info(f"Resume (LaTeX): {gen_result['tailored_resume_path']}")
-        logger.info("  → Copy to Overleaf to generate PDF")
-        logger.info(f"Cover Letter: {gen_result['cover_letter_path']}")
-        logger.info("  → Ready to use!")
-        logger.info("\nTip: Review both files before submitting")
-        logger.info("=" * 60)
+        _report_success(gen_result, tip=True)
 
         if _open_in_vscode(folder_path):
             logger.info("Opened folder in VS Code")
 
-    except APIKeyError as e:
-        logger.error("=" * 60)
-        logger.error("GROQ_API_KEY not found!")
-        logger.error("=" * 60)
-        logger.error("\nTo use AI generation, add your API key to .env file:")
-        logger.error("1. Get API key: https://console.groq.com/keys")
-        logger.error("2. Create .env file:")
-        logger.error('   echo "GROQ_API_KEY=your-key-here" > .env')
-        logger.error("\nOr set environment variable:")
-        logger.error('   export GROQ_API_KEY="your-key-here"')
-        logger.error("=" * 60)
+    except APIKeyError:
+        _report_api_key_error()
         sys.exit(1)
     except Exception as e:
         logger.error(f"AI generation failed: {e}")
         sys.exit(1)
 
 
+def _pack_cover_letters(
+    jobs: list[tuple[Path, dict[str, Any]]],
+    pack: int,
+    model: str,
+    max_workers: int,
+) -> set[Path]:
+    """Write cover letters for batch folders, several per Groq request.
+
+    Folders are grouped by identical master resume, the context the letters
+    share, into requests of at most ``pack`` jobs.
+
+    Args:
+        jobs: (folder, job data) pairs
+        pack: Maximum letters per request
+        model: Groq model to use
+        max_workers: Maximum number of requests in flight
+
+    Returns:
+        Folders whose Cover_Letter.txt was written; the rest still need a
+        request of their own
+
+    Raises:
+        APIKeyError: If API key is missing or invalid
+    """
+    import file_ops
+    import groq_client
+
+    by_resume: dict[str, list[tuple[Path, dict[str, Any]]]] = {}
+    for folder_path, job_data in jobs:
+        master_resume = (folder_path / "resume-template.tex").read_text(encoding="utf-8")
+        by_resume.setdefault(master_resume, []).append((folder_path, job_data))
+
+    pack = min(pack, groq_client.MAX_PACKED_COVER_LETTERS)
+    groups = [
+        (master_resume, members[i : i + pack])
+        for master_resume, members in by_resume.items()
+        for i in range(0, len(members), pack)
+    ]
+
+    def write_group(master_resume: str, group: list[tuple[Path, dict[str, Any]]]) -> list[Path]:
+        letters = groq_client.generate_cover_letters([job for _, job in group], master_resume, model=model)
+        written = []
+        for (folder_path, _), letter in zip(group, letters):
+            if letter is not None:
+                file_ops.atomic_write_text(folder_path / "Cover_Letter.txt", letter)
+                logger.info(f"{folder_path.name}: Cover_Letter.txt generated")
+                written.append(folder_path)
+        return written
+
+    packed: set[Path] = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        # A lone job gains nothing from packing and goes through the normal path
+        futures = [ex.submit(write_group, m, group) for m, group in groups if len(group) > 1]
+        _flush_logs()
+        for future in as_completed(futures):
+            try:
+                packed.update(future.result())
+            except APIKeyError:
+                raise
+            except Exception as e:
+                logger.warning(f"Packed cover letter request failed, falling back to one per folder: {e}")
+
+    if len(packed) < len(jobs):
+        logger.info(f"Writing the remaining {len(jobs) - len(packed)} cover letters individually")
+    return packed
+
+
+def generate_batch(args: argparse.Namespace) -> None:
+    """Generate AI content for several existing job folders concurrently.
+
+    Args:
+        args: Command line arguments
+    """
+    jobs: list[tuple[Path, dict[str, Any]]] = []
+    for folder in args.folders:
+        folder_path = Path(folder)
+        job_desc_file = _find_job_description(folder_path) if folder_path.is_dir() else None
+        if job_desc_file is None or not (folder_path / "resume-template.tex").exists():
+            logger.error(f"Skipping {folder_path}: not a complete job folder (run 'scrape' first)")
+            continue
+        jobs.append((folder_path, _read_job_data(folder_path, job_desc_file)))
+
+    if not jobs:
+        logger.error("Error: No job folders to process.")
+        sys.exit(1)
+
+    logger.info(f"Generating AI content for {len(jobs)} folders...")
+
+    packed: set[Path] = set()
+    try:
+        if args.pack > 1:
+            packed = _pack_cover_letters(jobs, args.pack, args.model, max(1, args.max_concurrency))
+        failed = _generate_folders(jobs, packed, args)
+    except APIKeyError as e:
+        # An auth failure affects every folder; the pool has already shut down
+        logger.error(str(e))
+        logger.error("Stopping batch. Check GROQ_API_KEY and run 'python3 job_tool.py test'.")
+        sys.exit(1)
+
+    logger.info(f"Generated content for {len(jobs) - failed} of {len(jobs)} folders")
+    if failed:
+        sys.exit(1)
+
+
+def _generate_folders(jobs: list[tuple[Path, dict[str, Any]]], packed: set[Path], args: argparse.Namespace) -> int:
+    """Generate AI content for each job folder on a thread pool.
+
+    Args:
+        jobs: (folder, job data) pairs
+        packed: Folders whose cover letter was already written by a packed request
+        args: Command line arguments (model, concurrency, cleanup)
+
+    Returns:
+        Number of folders that failed
+
+    Raises:
+        APIKeyError: If the API key is rejected; folders not yet started are cancelled
+    """
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, args.max_concurrency)) as ex:
+        futures = {
+            ex.submit(
+                _generate_ai_content,
+                job_data,
+                folder_path,
+                model=args.model,
+                with_cover_letter=folder_path not in packed,
+            ): folder_path
+            for folder_path, job_data in jobs
+        }
+        for future in as_completed(futures):
+            folder_path = futures[future]
+            if future.cancelled():
+                continue
+            try:
+                future.result()
+            except APIKeyError:
+                # Don't start the remaining folders
+                for pending in futures:
+                    pending.cancel()
+                raise
+            except Exception as e:
+                failed += 1
+                logger.error(f"{folder_path.name}: AI generation failed: {e}")
+                continue
+
+            if args.cleanup:
+                _cleanup_templates(folder_path)
+            logger.info(f"{folder_path.name}: done")
+            _flush_logs()
+    return failed
+
+
 def test_api(args: argparse.Namespace) -> None:  # noqa: ARG001
     """Test Groq API key.
 
@@ -396,12 +715,26 @@ def test_api(args: argparse.Namespace) -> None:  # noqa: ARG001
         sys.exit(1)
 
 
-def main() -> None:
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        description="Job application workflow: scrape → setup → AI generation.",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+def _add_cache_arguments(subparser: argparse.ArgumentParser) -> None:
+    """Add the on-disk cache flags to a subcommand parser.
+
+    Args:
+        subparser: Subcommand parser to extend
+    """
+    subparser.add_argument(
+        "--no-cache", action="store_true", help="Ignore and do not store cached job pages or AI responses"
+    )
+    subparser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=cache.DEFAULT_TTL / 3600,
+        metavar="HOURS",
+        help="Maximum age of cached job pages and AI responses in hours (default: 24)",
+    )
+
+
+# Usage examples shown after the option list of ``--help``
+_EPILOG = """
 WORKFLOW:
   Step 1 - Scrape job posting:
       python3 job_tool.py scrape "https://linkedin.com/jobs/view/123"
@@ -428,20 +761,46 @@ QUICK START:
   # Generate + cleanup template files
   python3 job_tool.py generate AI-Soft-Engi-Thomson-Reuters/ --cleanup
 
+  # Scrape several postings at once
+  python3 job_tool.py scrape "URL1" "URL2" "URL3"
+
+  # Generate for several folders at once
+  python3 job_tool.py generate-batch Folder-One/ Folder-Two/ --cleanup
+  python3 job_tool.py generate-batch Folder-*/ --pack 4
+
 SETUP:
   1. Edit templates/resume-template.tex with your info (one-time)
   2. Set GROQ_API_KEY in .env file:
        echo "GROQ_API_KEY=your-key-here" > .env
   3. Test: python3 job_tool.py test
   4. Start scraping and generating!
-        """,
+        """
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once per process.
+
+    Returns:
+        Parser with all subcommands registered
+    """
+    parser = argparse.ArgumentParser(
+        description="Job application workflow: scrape → setup → AI generation.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # Scrape command
     scrape_parser = subparsers.add_parser("scrape", help="Scrape job posting and create template folder (Step 1)")
-    scrape_parser.add_argument("url", nargs="?", help="Job posting URL or JSON file path")
+    scrape_parser.add_argument("url", nargs="*", help="Job posting URL(s) or JSON file path(s)")
+    scrape_parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=5,
+        help="Maximum number of job postings scraped at once (default: 5)",
+    )
     scrape_parser.add_argument(
         "-g", "--generate", action="store_true", help="Also generate AI content immediately (skip Step 2)"
     )
@@ -451,6 +810,7 @@ SETUP:
     scrape_parser.add_argument(
         "--model", default="llama-3.3-70b-versatile", help="Groq model to use (default: llama-3.3-70b-versatile)"
     )
+    _add_cache_arguments(scrape_parser)
     scrape_parser.set_defaults(func=scrape_job)
 
     # Generate command
@@ -466,18 +826,71 @@ SETUP:
         action="store_true",
         help="Remove template files after generation (prompt.txt, prompt-cover.txt, resume-template.tex)",
     )
+    _add_cache_arguments(gen_parser)
     gen_parser.set_defaults(func=generate_content)
 
+    # Batch generate command
+    batch_parser = subparsers.add_parser(
+        "generate-batch", help="Generate AI content for several job folders concurrently"
+    )
+    batch_parser.add_argument("folders", nargs="+", help="Paths to job folders created by scrape command")
+    batch_parser.add_argument(
+        "--model", default="llama-3.3-70b-versatile", help="Groq model to use (default: llama-3.3-70b-versatile)"
+    )
+    batch_parser.add_argument(
+        "--cleanup", action="store_true", help="Remove template files from each folder after generation"
+    )
+    batch_parser.add_argument(
+        "--max-concurrency", type=int, default=4, help="Maximum number of folders processed at once (default: 4)"
+    )
+    batch_parser.add_argument(
+        "--pack",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Write cover letters for up to N folders (max 4) that share a master resume "
+        "in one API request (default: 1, one request per letter)",
+    )
+    _add_cache_arguments(batch_parser)
+    batch_parser.set_defaults(func=generate_batch)
+
     # Test command
     test_parser = subparsers.add_parser("test", help="Test if Groq API key is working")
     test_parser.set_defaults(func=test_api)
 
+    return parser
+
+
+def _warm_up_groq() -> None:
+    """Start the TCP/TLS handshake with the Groq API in the background.
+
+    Runs while the command reads files or scrapes, so the first API call
+    finds an open connection in the pool.
+    """
+
+    def warm_up() -> None:
+        import groq_client
+
+        groq_client.warm_up()
+
+    threading.Thread(target=warm_up, name="groq-warm-up", daemon=True).start()
+
+
+def main() -> None:
+    """Main CLI entry point."""
+    parser = _build_parser()
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
+    if hasattr(args, "no_cache"):
+        cache.configure(enabled=not args.no_cache, ttl=args.cache_ttl * 3600)
+
+    if args.command in ("generate", "generate-batch", "test") or getattr(args, "generate", False):
+        _warm_up_groq()
+
     args.func(args)
 
 
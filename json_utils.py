@@ -0,0 +1,51 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize JSON from text or UTF-8 bytes.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to compact JSON text.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def dumpb(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
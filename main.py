@@ -1,87 +1,126 @@
 """FastAPI web interface for job scraper."""
 
 import asyncio
+import contextlib
+import hashlib
+import logging
+import os
 import sys
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from datetime import datetime
+from email.utils import formatdate
 from pathlib import Path
 from typing import Optional
 
-from fastapi import FastAPI, Form, HTTPException, Query
-from fastapi.responses import FileResponse, HTMLResponse, PlainTextResponse
+from fastapi import BackgroundTasks, FastAPI, Form, HTTPException, Query, Request
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
+import ai_generation
+import cache
+import file_ops
+import groq_client
+import json_utils
 import processor
 from database import Application, ApplicationDB
 from scraper import scrape_job as scraper_scrape_job
 
-app = FastAPI(title="CrackATS")
+logger = logging.getLogger(__name__)
+
+# orjson serializes the large LaTeX/cover-letter payloads several times faster
+app = FastAPI(
+    title="CrackATS",
+    default_response_class=ORJSONResponse if json_utils.orjson is not None else JSONResponse,
+)
 app.mount("/static", StaticFiles(directory="static"), name="static")
-executor = ThreadPoolExecutor(max_workers=3)
+# Scrapes run on asyncio's default thread pool (shared with the file I/O offloads);
+# cap how many can hold a thread at once so they cannot starve the rest
+_scrape_slots = asyncio.Semaphore(4)
+
+# The page is static for the life of the process: read and hash it once
+_INDEX_HTML = (Path(__file__).parent / "static" / "index.html").read_bytes()
+_INDEX_ETAG = f'"{hashlib.sha1(_INDEX_HTML, usedforsecurity=False).hexdigest()}"'
+
+# Job folder name -> (folder mtime, whether it holds a Resume.tex). Creating or
+# deleting Resume.tex changes its folder's mtime, so only folders whose mtime
+# moved are probed again. Refreshes build a new dict and swap it in; the lock
+# keeps concurrent refreshes from interleaving.
+_resume_index: dict[str, tuple[int, bool]] = {}
+_resume_index_lock = threading.Lock()
+
+
+def _refresh_resume_index():
+    """Bring the resume index up to date with the working directory."""
+    global _resume_index
+
+    with _resume_index_lock:
+        previous = _resume_index
+        index: dict[str, tuple[int, bool]] = {}
+        with os.scandir(Path.cwd()) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith((".", "_")) or name == "venv":
+                    continue
+                try:
+                    if not entry.is_dir():
+                        continue
+                    mtime = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+                known = previous.get(name)
+                if known is not None and known[0] == mtime:
+                    index[name] = known
+                else:
+                    index[name] = (mtime, os.path.exists(os.path.join(entry.path, "Resume.tex")))
+        _resume_index = index
+    return index
+
+
+# Documents change rarely; let the browser revalidate instead of re-downloading
+_REVALIDATE = "private, max-age=0, must-revalidate"
+
+
+def _read_if_modified(path, if_none_match, read=None):
+    """Read a text file unless the client's cached copy (by ETag) is still current.
+
+    Returns a (headers, content) pair; content is None when a 304 should be sent.
+    Raises FileNotFoundError if the file doesn't exist.
+    """
+    st = os.stat(path)
+    headers = {
+        "ETag": f'"{st.st_mtime_ns:x}-{st.st_size:x}"',
+        "Last-Modified": formatdate(st.st_mtime, usegmt=True),
+        "Cache-Control": _REVALIDATE,
+    }
+    if if_none_match == headers["ETag"]:
+        return headers, None
+    content = read(path) if read else Path(path).read_text(encoding="utf-8")
+    return headers, content
 
 
-def _generate_ai_content(job_data, folder_path):
-    """Generate tailored resume and cover letter using Groq API."""
-    try:
-        import groq_client
-    except ImportError:
-        raise RuntimeError("groq_client module not found.")
+async def _generate_ai_content(job_data, folder_path):
+    """Generate tailored resume and cover letter using Groq API.
 
+    Runs the generator shared with the CLI (both Groq calls concurrently,
+    the cover letter grounded in the master resume) off the event loop.
+    Template cleanup is left to the caller so it can overlap other work.
+    """
     folder = Path(folder_path)
-    master_resume_path = folder / "resume-template.tex"
-
-    if not master_resume_path.exists():
-        raise FileNotFoundError(f"Master resume not found: {master_resume_path}")
-
-    master_resume = master_resume_path.read_text(encoding="utf-8")
-
-    tailored_resume = groq_client.generate_tailored_resume(
-        job_description=job_data["description"],
-        master_resume=master_resume,
-    )
-
-    if tailored_resume.startswith("```latex"):
-        tailored_resume = tailored_resume[8:]
-    if tailored_resume.startswith("```"):
-        tailored_resume = tailored_resume[3:]
-    if tailored_resume.endswith("```"):
-        tailored_resume = tailored_resume[:-3]
-    tailored_resume = tailored_resume.strip()
-
-    tailored_resume_path = folder / "Resume.tex"
-    tailored_resume_path.write_text(tailored_resume, encoding="utf-8")
-
-    cover_letter = groq_client.generate_cover_letter(
-        job_description=job_data["description"],
-        tailored_resume=tailored_resume,
-        company_name=job_data["company"],
-        job_title=job_data["title"],
-    )
-
-    if cover_letter.startswith("```"):
-        cover_letter = cover_letter[3:]
-    if cover_letter.endswith("```"):
-        cover_letter = cover_letter[:-3]
-    cover_letter = cover_letter.strip()
-
-    cover_letter_path = folder / "Cover_Letter.txt"
-    cover_letter_path.write_text(cover_letter, encoding="utf-8")
-
-    for filename in ["prompt.txt", "prompt-cover.txt", "resume-template.tex"]:
-        file_path = folder / filename
-        if file_path.exists():
-            file_path.unlink()
+    result = await asyncio.to_thread(ai_generation.generate, job_data, folder)
 
     return {
-        "tailored_resume": tailored_resume,
-        "cover_letter": cover_letter,
+        "tailored_resume": result["tailored_resume"],
+        "cover_letter": result["cover_letter"],
         "folder": folder.name,
     }
 
 
 @app.get("/", response_class=HTMLResponse)
-async def root():
-    html_path = Path(__file__).parent / "static" / "index.html"
-    return html_path.read_text(encoding="utf-8")
+async def root(request: Request):
+    headers = {"ETag": _INDEX_ETAG}
+    if request.headers.get("if-none-match") == _INDEX_ETAG:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(_INDEX_HTML, headers=headers)
 
 
 @app.post("/scrape-and-generate")
@@ -91,21 +130,18 @@ async def scrape_and_generate(url: str = Form(...)):
         raise HTTPException(status_code=400, detail="URL is required")
 
     try:
-        loop = asyncio.get_event_loop()
-        job = await loop.run_in_executor(executor, scraper_scrape_job, url)
+        async with _scrape_slots:
+            job = await asyncio.to_thread(scraper_scrape_job, url)
 
         if not job:
             raise HTTPException(status_code=404, detail="Could not extract job data")
 
-        result = processor.process_job(job, Path.cwd(), url)
+        result = await asyncio.to_thread(processor.process_job, job, Path.cwd(), url)
 
         try:
-            gen_result = _generate_ai_content(job, result["folder_path"])
+            gen_result = await _generate_ai_content(job, result["folder_path"])
 
             # Auto-create application entry
-            import json
-            from datetime import datetime
-
             app = Application(
                 company=job.get("company", ""),
                 title=job.get("title", ""),
@@ -114,9 +150,13 @@ async def scrape_and_generate(url: str = Form(...)):
                 date_applied=datetime.now().strftime("%Y-%m-%d"),
                 resume_path=str(Path(result["folder_path"]) / "Resume.tex"),
                 cover_letter_path=str(Path(result["folder_path"]) / "Cover_Letter.txt"),
-                tags=json.dumps(["ai-generated"]),
+                tags=json_utils.dumps(["ai-generated"]),
+            )
+            # The tracker entry and the template cleanup are independent
+            _, app_id = await asyncio.gather(
+                asyncio.to_thread(ai_generation.cleanup_templates, result["folder_path"]),
+                asyncio.to_thread(ApplicationDB.create, app),
             )
-            app_id = ApplicationDB.create(app)
 
             return {
                 "success": True,
@@ -142,66 +182,109 @@ async def scrape_and_generate(url: str = Form(...)):
 @app.get("/list-resumes")
 async def list_resumes():
     """List all generated Resume.tex files."""
-    resumes = []
+    index = await asyncio.to_thread(_refresh_resume_index)
     cwd = Path.cwd()
-
-    for item in cwd.iterdir():
-        if item.is_dir() and not item.name.startswith((".", "_", "venv", "__")):
-            resume_file = item / "Resume.tex"
-            if resume_file.exists():
-                resumes.append(
-                    {
-                        "folder": item.name,
-                        "path": str(resume_file),
-                    }
-                )
-
-    return sorted(resumes, key=lambda x: x["folder"], reverse=True)
+    return [
+        {"folder": name, "path": str(cwd / name / "Resume.tex")}
+        for name in sorted(index, reverse=True)
+        if index[name][1]
+    ]
 
 
 @app.get("/resume/{folder}")
-async def get_resume(folder: str):
+async def get_resume(folder: str, request: Request, response: Response):
     """Get a specific Resume.tex content."""
     resume_path = Path.cwd() / folder / "Resume.tex"
 
-    if not resume_path.exists():
-        raise HTTPException(status_code=404, detail="Resume not found")
-
-    content = resume_path.read_text(encoding="utf-8")
+    try:
+        headers, content = await asyncio.to_thread(
+            _read_if_modified, resume_path, request.headers.get("if-none-match")
+        )
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Resume not found") from None
+    if content is None:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
     return {"content": content, "folder": folder}
 
 
 @app.get("/cover-letter/{folder}")
-async def get_cover_letter(folder: str):
+async def get_cover_letter(folder: str, request: Request, response: Response):
     """Get a specific Cover_Letter.txt content."""
     cover_path = Path.cwd() / folder / "Cover_Letter.txt"
 
-    if not cover_path.exists():
-        raise HTTPException(status_code=404, detail="Cover letter not found")
-
-    content = cover_path.read_text(encoding="utf-8")
+    try:
+        headers, content = await asyncio.to_thread(
+            _read_if_modified, cover_path, request.headers.get("if-none-match")
+        )
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Cover letter not found") from None
+    if content is None:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
     return {"content": content, "folder": folder}
 
 
 @app.get("/template")
-async def get_template():
+async def get_template(request: Request, response: Response):
     """Get the master resume template content."""
     template_path = Path(__file__).parent / "templates" / "resume-template.tex"
 
-    if not template_path.exists():
-        raise HTTPException(status_code=404, detail="Template not found")
-
-    content = template_path.read_text(encoding="utf-8")
+    try:
+        headers, content = await asyncio.to_thread(
+            _read_if_modified, template_path, request.headers.get("if-none-match"), file_ops.read_text_cached
+        )
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Template not found") from None
+    if content is None:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
     return {"content": content}
 
 
+async def _raw_file_response(path: Path, detail: str):
+    """Send a document straight from disk (sendfile where the server supports it)."""
+    if not await asyncio.to_thread(path.is_file):
+        raise HTTPException(status_code=404, detail=detail)
+    return FileResponse(path, media_type="text/plain; charset=utf-8", headers={"Cache-Control": _REVALIDATE})
+
+
+def _job_file(folder: str, filename: str) -> Path:
+    """Locate a file inside a job folder, rejecting names that leave the working directory.
+
+    The folder name itself is validated (not the resolved path), so symlinked
+    job folders listed by /list-resumes are served like any other.
+    """
+    if folder in ("", ".", "..") or Path(folder).name != folder:
+        raise HTTPException(status_code=403, detail="Invalid file path")
+    return Path.cwd() / folder / filename
+
+
+@app.get("/raw/resume/{folder}")
+async def get_raw_resume(folder: str):
+    """Get a specific Resume.tex as plain text, without a JSON wrapper."""
+    return await _raw_file_response(_job_file(folder, "Resume.tex"), "Resume not found")
+
+
+@app.get("/raw/cover-letter/{folder}")
+async def get_raw_cover_letter(folder: str):
+    """Get a specific Cover_Letter.txt as plain text, without a JSON wrapper."""
+    return await _raw_file_response(_job_file(folder, "Cover_Letter.txt"), "Cover letter not found")
+
+
+@app.get("/raw/template")
+async def get_raw_template():
+    """Get the master resume template as plain text, without a JSON wrapper."""
+    return await _raw_file_response(Path(__file__).parent / "templates" / "resume-template.tex", "Template not found")
+
+
 @app.post("/template")
 async def save_template(content: str = Form(...)):
     """Save the master resume template."""
     template_path = Path(__file__).parent / "templates" / "resume-template.tex"
 
     try:
-        template_path.write_text(content, encoding="utf-8")
+        await asyncio.to_thread(file_ops.atomic_write_text, template_path, content)
         return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -222,7 +305,7 @@ async def save_document(content: str = Form(...), path: str = Form(...)):
         except ValueError:
             raise HTTPException(status_code=403, detail="Invalid file path")
 
-        file_path.write_text(content, encoding="utf-8")
+        await asyncio.to_thread(file_ops.atomic_write_text, file_path, content)
         return {"success": True, "message": "Document saved successfully"}
     except HTTPException:
         raise
@@ -239,43 +322,60 @@ async def health():
 
 
 def cleanup_orphaned_applications():
-    """Remove database entries for applications whose folders no longer exist."""
+    """Remove database entries for applications whose files no longer exist."""
     applications = ApplicationDB.get_all()
-    deleted_count = 0
+    if not applications:
+        return 0
+
+    # One directory read tells which job folders still exist, so files in a
+    # deleted folder are known missing without a stat() each
+    cwd = Path.cwd()
+    with os.scandir(cwd) as entries:
+        live_folders = {entry.name for entry in entries if entry.is_dir()}
 
-    for app in applications:
-        # Check if the resume file exists
-        resume_path = app.get("resume_path")
-        if resume_path:
-            if not Path(resume_path).exists():
-                # Resume file doesn't exist, delete this application
-                ApplicationDB.delete(app["id"])
-                deleted_count += 1
-                continue
+    def missing(path):
+        path = Path(path)
+        if path.parent.parent == cwd and path.parent.name not in live_folders:
+            return True
+        return not path.exists()
 
-        # Also check cover letter if no resume path
-        cover_path = app.get("cover_letter_path")
-        if cover_path and not Path(cover_path).exists():
-            ApplicationDB.delete(app["id"])
-            deleted_count += 1
+    # An application is orphaned if its resume or its cover letter is gone
+    dead_ids = [
+        app["id"]
+        for app in applications
+        if any(path and missing(path) for path in (app.get("resume_path"), app.get("cover_letter_path")))
+    ]
+    return ApplicationDB.delete_many(dead_ids)
 
-    return deleted_count
+
+# Orphaned applications are swept periodically instead of on every list request
+_CLEANUP_INTERVAL = 300  # seconds
+_cleanup_task: Optional[asyncio.Task] = None
+
+
+async def _periodic_cleanup():
+    """Run cleanup_orphaned_applications in a worker thread every few minutes."""
+    while True:
+        try:
+            await asyncio.to_thread(cleanup_orphaned_applications)
+        except Exception:
+            logger.exception("Orphaned application cleanup failed")
+        await asyncio.sleep(_CLEANUP_INTERVAL)
 
 
 @app.get("/api/applications")
 async def get_applications(
+    background_tasks: BackgroundTasks,
     status: Optional[str] = Query(None, description="Filter by status"),
-    cleanup: bool = Query(True, description="Remove orphaned entries"),
+    cleanup: bool = Query(False, description="Also remove orphaned entries after responding"),
 ):
     """Get all job applications, optionally filtered by status."""
-    if status and status not in Application.STATUSES:
-        raise HTTPException(
-            status_code=400, detail=f"Invalid status. Must be one of: {', '.join(Application.STATUSES)}"
-        )
+    if status and status not in Application.STATUS_SET:
+        raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {Application.STATUSES_STR}")
 
-    # Clean up orphaned entries by default
+    # A background sweep handles orphans; an explicit request runs one after the response
     if cleanup:
-        cleanup_orphaned_applications()
+        background_tasks.add_task(cleanup_orphaned_applications)
 
     applications = ApplicationDB.get_all(status=status)
     return applications
@@ -310,12 +410,8 @@ async def create_application(
     tags: str = Form("[]"),
 ):
     """Create a new job application."""
-    if status not in Application.STATUSES:
-        raise HTTPException(
-            status_code=400, detail=f"Invalid status. Must be one of: {', '.join(Application.STATUSES)}"
-        )
-
-    import json
+    if status not in Application.STATUS_SET:
+        raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {Application.STATUSES_STR}")
 
     app = Application(
         company=company,
@@ -326,7 +422,7 @@ async def create_application(
         date_applied=date_applied if date_applied else None,
         salary=salary,
         location=location,
-        tags=json.loads(tags) if tags else [],
+        tags=json_utils.loads(tags) if tags else [],
     )
 
     app_id = ApplicationDB.create(app)
@@ -351,12 +447,8 @@ async def update_application(
     if not existing:
         raise HTTPException(status_code=404, detail="Application not found")
 
-    if status and status not in Application.STATUSES:
-        raise HTTPException(
-            status_code=400, detail=f"Invalid status. Must be one of: {', '.join(Application.STATUSES)}"
-        )
-
-    import json
+    if status and status not in Application.STATUS_SET:
+        raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {Application.STATUSES_STR}")
 
     updates = {}
     if company is not None:
@@ -376,7 +468,7 @@ async def update_application(
     if location is not None:
         updates["location"] = location
     if tags is not None:
-        updates["tags"] = json.loads(tags) if tags else []
+        updates["tags"] = json_utils.loads(tags) if tags else []
 
     ApplicationDB.update(app_id, **updates)
     return {"message": "Application updated successfully"}
@@ -415,10 +507,10 @@ async def update_application_status(app_id: int, status: str = Form(...)):
     print(f"DEBUG: Received status update request: app_id={app_id}, status='{status}'")
     print(f"DEBUG: Valid statuses: {Application.STATUSES}")
 
-    if status not in Application.STATUSES:
+    if status not in Application.STATUS_SET:
         print(f"DEBUG: Status '{status}' not in valid statuses!")
         raise HTTPException(
-            status_code=400, detail=f"Invalid status '{status}'. Must be one of: {', '.join(Application.STATUSES)}"
+            status_code=400, detail=f"Invalid status '{status}'. Must be one of: {Application.STATUSES_STR}"
         )
 
     existing = ApplicationDB.get_by_id(app_id)
@@ -450,16 +542,14 @@ async def debug_statuses():
     """Debug endpoint to check loaded statuses."""
     return {
         "statuses": Application.STATUSES,
-        "has_shortlisted": "shortlisted" in Application.STATUSES,
-        "has_phone_screen": "phone_screen" in Application.STATUSES,
+        "has_shortlisted": "shortlisted" in Application.STATUS_SET,
+        "has_phone_screen": "phone_screen" in Application.STATUS_SET,
     }
 
 
 @app.get("/api/config")
 async def get_config():
     """Get application configuration (safe values only)."""
-    import os
-
     return {
         "groq_api_key": os.environ.get("GROQ_API_KEY", ""),
         "groq_model": os.environ.get("GROQ_MODEL", "llama-3.3-70b-versatile"),
@@ -469,7 +559,6 @@ async def get_config():
 @app.post("/api/config")
 async def update_config(api_key: str = Form(...)):
     """Update API key in configuration."""
-    import os
     import re
 
     # Validate API key format
@@ -477,15 +566,15 @@ async def update_config(api_key: str = Form(...)):
         raise HTTPException(status_code=400, detail="Invalid API key format. Groq keys must start with 'gsk_'")
 
     try:
-        # Update environment variable
-        os.environ["GROQ_API_KEY"] = api_key
+        # Update environment variable and the key cached by the Groq client
+        groq_client.set_api_key(api_key)
 
         # Update or create .env file
         env_file = Path(__file__).parent / ".env"
 
         if env_file.exists():
             # Read existing content
-            content = env_file.read_text(encoding="utf-8")
+            content = await asyncio.to_thread(env_file.read_text, encoding="utf-8")
 
             # Check if GROQ_API_KEY already exists
             if re.search(r"^GROQ_API_KEY\s*=\s*", content, re.MULTILINE):
@@ -499,14 +588,12 @@ async def update_config(api_key: str = Form(...)):
             content = f"GROQ_API_KEY={api_key}\n"
 
         # Write to file
-        env_file.write_text(content, encoding="utf-8")
+        await asyncio.to_thread(env_file.write_text, content, encoding="utf-8")
 
         # Test the key
         test_result = False
         try:
-            import groq_client
-
-            test_result = groq_client.test_api_key()
+            test_result = await asyncio.to_thread(groq_client.test_api_key)
         except Exception as e:
             print(f"API key test failed: {e}")
 
@@ -515,15 +602,47 @@ async def update_config(api_key: str = Form(...)):
         raise HTTPException(status_code=500, detail=f"Failed to save API key: {str(e)}")
 
 
+# Startup work running in the default executor, referenced until it finishes
+_startup_jobs: set[asyncio.Future] = set()
+
+
+def _finish_startup_job(future: asyncio.Future) -> None:
+    """Drop a finished startup job and log its exception, if any."""
+    _startup_jobs.discard(future)
+    if not future.cancelled() and (exc := future.exception()) is not None:
+        logger.error(f"Background startup task failed: {exc!r}")
+
+
 @app.on_event("startup")
 async def startup_event():
-    """Run database migration on startup."""
+    """Run database migration, pre-connect to the Groq API, prune the cache and start the orphan sweep."""
+    global _cleanup_task
+
     from paths import get_db_path, migrate_legacy_database
 
+    # Handshake in the background so the first generation skips TCP/TLS setup;
+    # drop expired Groq/scrape cache entries so the cache does not grow forever
+    loop = asyncio.get_running_loop()
+    for job in (groq_client.warm_up, cache.prune):
+        future = loop.run_in_executor(None, job)
+        _startup_jobs.add(future)
+        future.add_done_callback(_finish_startup_job)
+
     migrated = migrate_legacy_database()
     if migrated:
         print(f"✓ Database migrated to: {get_db_path()}")
 
+    _cleanup_task = asyncio.create_task(_periodic_cleanup())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the orphan sweep."""
+    if _cleanup_task is not None:
+        _cleanup_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _cleanup_task
+
 
 @app.get("/tex-export/{folder}/{filename}")
 async def export_tex_for_overleaf(folder: str, filename: str):
@@ -561,11 +680,10 @@ async def export_tex_for_overleaf(folder: str, filename: str):
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="File not found")
 
-    # Read and return content as plain text
-    content = file_path.read_text(encoding="utf-8")
-
-    return PlainTextResponse(
-        content,
+    # Serve the file as plain text straight from disk
+    return FileResponse(
+        file_path,
+        media_type="text/plain",
         headers={
             "Access-Control-Allow-Origin": "*",
             "Content-Disposition": f'inline; filename="{filename}"',
@@ -36,6 +36,30 @@ def get_user_data_dir() -> Path:
     return data_dir
 
 
+def get_cache_dir() -> Path:
+    """Get cross-platform cache directory for CrackATS.
+
+    Returns:
+        Path to cache directory (creates if doesn't exist)
+
+    Platform locations:
+        - Windows: %LOCALAPPDATA%/CrackATS/Cache
+        - macOS: ~/Library/Caches/CrackATS
+        - Linux: $XDG_CACHE_HOME/crackats (default ~/.cache/crackats)
+    """
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData/Local"))
+        cache_dir = base / "CrackATS" / "Cache"
+    elif sys.platform == "darwin":
+        cache_dir = Path.home() / "Library/Caches/CrackATS"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        cache_dir = base / "crackats"
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
 def get_db_path() -> Path:
     """Get database path in user data directory."""
     return get_user_data_dir() / "applications.db"
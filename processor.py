@@ -139,13 +139,20 @@ def process_job(
 
     logger.info(f"Processing job: {title} at {company} -> {folder_name}")
 
+    file_path, prompt_path, cover_prompt_path, resume_template_path = file_ops.bulk_write(
+        [
+            lambda: file_ops.write_description(folder, f"{folder_name}.txt", desc, source_url=source_url),
+            lambda: file_ops.write_prompt_file(folder, "prompt.txt", prompt_creator.get_main_prompt(), desc),
+            lambda: file_ops.write_prompt_file(folder, "prompt-cover.txt", prompt_creator.get_cover_prompt(), desc),
+            lambda: file_ops.copy_template(_TEMPLATES / "resume-template.tex", folder),
+        ]
+    )
+
     return {
         "folder_name": folder_name,
         "folder_path": folder,
-        "file_path": file_ops.write_description(folder, f"{folder_name}.txt", desc, source_url=source_url),
-        "prompt_path": file_ops.write_prompt_file(folder, "prompt.txt", prompt_creator.get_main_prompt(), desc),
-        "cover_prompt_path": file_ops.write_prompt_file(
-            folder, "prompt-cover.txt", prompt_creator.get_cover_prompt(), desc
-        ),
-        "resume_template_path": file_ops.copy_template(_TEMPLATES / "resume-template.tex", folder),
+        "file_path": file_path,
+        "prompt_path": prompt_path,
+        "cover_prompt_path": cover_prompt_path,
+        "resume_template_path": resume_template_path,
     }
@@ -0,0 +1,68 @@
+"""Client-side pacing of Groq API requests to stay under per-minute limits."""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Token buckets for requests-per-minute and tokens-per-minute limits.
+
+    Each call to :meth:`acquire` reserves its share of both buckets right
+    away (they may go negative) and then sleeps until the buckets have
+    refilled past the debt. Concurrent callers are therefore spaced out in
+    arrival order instead of all firing and getting HTTP 429 back.
+
+    A limit of 0 or less disables that bucket.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float) -> None:
+        """Create a limiter whose buckets start full.
+
+        Args:
+            requests_per_minute: Requests allowed per minute (0 or less: unlimited)
+            tokens_per_minute: Estimated tokens allowed per minute (0 or less: unlimited)
+        """
+        self._rpm = float(requests_per_minute)
+        self._tpm = float(tokens_per_minute)
+        self._requests = max(self._rpm, 0.0)
+        self._tokens = max(self._tpm, 0.0)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add capacity for the time elapsed since the last update."""
+        elapsed = now - self._updated
+        self._updated = now
+        if self._rpm > 0:
+            self._requests = min(self._rpm, self._requests + elapsed * self._rpm / 60)
+        if self._tpm > 0:
+            self._tokens = min(self._tpm, self._tokens + elapsed * self._tpm / 60)
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until one request of ``tokens`` estimated tokens may be sent.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            wait = 0.0
+            if self._rpm > 0:
+                self._requests -= 1
+                wait = max(wait, -self._requests * 60 / self._rpm)
+            if self._tpm > 0:
+                # A request larger than the whole bucket would otherwise never fit
+                self._tokens -= min(tokens, self._tpm)
+                wait = max(wait, -self._tokens * 60 / self._tpm)
+
+        if wait > 0:
+            # WARNING so buffering handlers show it before the sleep, not after
+            logger.warning(f"Pacing request for rate limit: waiting {wait:.1f}s")
+            time.sleep(wait)
+        return wait
@@ -13,6 +13,7 @@ import urllib.error
 import urllib.parse
 import urllib.request
 import zlib
+from functools import lru_cache
 from html.parser import HTMLParser
 from pathlib import Path
 
@@ -235,8 +236,13 @@ def _decompress(data, encoding):
     return data
 
 
+@lru_cache(maxsize=1)
 def _create_ssl_context():
-    """Create SSL context, handling macOS certificate issues."""
+    """Create SSL context, handling macOS certificate issues.
+
+    Loading the CA bundle is the slow part, so one context is shared by every
+    fetch (SSLContext is safe to use from several threads).
+    """
     try:
         import certifi
 
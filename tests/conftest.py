@@ -0,0 +1,33 @@
+"""Shared fixtures: every test gets its own database and cache directory."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+import cache
+import database
+
+
+@pytest.fixture
+def db_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Point ApplicationDB at a fresh database file and reset its shared state."""
+    path = tmp_path / "applications.db"
+    monkeypatch.setattr(database, "get_db_path_dynamic", lambda: path)
+    database.ApplicationDB._close()
+    database.ApplicationDB._cache.clear()
+    yield path
+    database.ApplicationDB._close()
+    database.ApplicationDB._cache.clear()
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Point the on-disk cache at a temporary directory with default settings."""
+    path = tmp_path / "cache"
+    path.mkdir()
+    monkeypatch.setattr(cache, "get_cache_dir", lambda: path)
+    monkeypatch.delenv("CRACKATS_NO_CACHE", raising=False)
+    cache.configure(enabled=True, ttl=cache.DEFAULT_TTL)
+    yield path
+    cache.configure(enabled=True, ttl=cache.DEFAULT_TTL)
@@ -0,0 +1,82 @@
+"""Tests for the on-disk response cache."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+import cache
+
+
+def _age(path: Path, seconds: float) -> None:
+    """Backdate a file's mtime by the given number of seconds."""
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def test_put_then_get_round_trips(cache_dir: Path) -> None:
+    key = cache.make_key("model", [{"role": "user", "content": "hi"}], 0.7)
+
+    assert cache.get("groq", key) is None
+    cache.put("groq", key, b"response")
+    assert cache.get("groq", key) == b"response"
+    # Namespaces are separate
+    assert cache.get("scrape", key) is None
+    assert not list((cache_dir / "groq").glob("*.tmp"))
+
+
+def test_make_key_depends_on_every_part() -> None:
+    assert cache.make_key("a", 1) == cache.make_key("a", 1)
+    assert cache.make_key("a", 1) != cache.make_key("a", 2)
+    assert cache.make_key("a", 1) != cache.make_key(["a", 1])
+
+
+def test_expired_entries_are_misses(cache_dir: Path) -> None:
+    key = cache.make_key("job")
+    cache.put("scrape", key, b"page")
+    _age(cache_dir / "scrape" / key, cache.DEFAULT_TTL + 60)
+
+    assert cache.get("scrape", key) is None
+
+    cache.configure(ttl=cache.DEFAULT_TTL * 2)
+    assert cache.get("scrape", key) == b"page"
+
+
+@pytest.mark.parametrize("disable", ["configure", "env"])
+def test_disabled_cache_neither_reads_nor_writes(
+    cache_dir: Path, monkeypatch: pytest.MonkeyPatch, disable: str
+) -> None:
+    key = cache.make_key("job")
+    cache.put("groq", key, b"old")
+    if disable == "configure":
+        cache.configure(enabled=False)
+    else:
+        monkeypatch.setenv("CRACKATS_NO_CACHE", "1")
+
+    assert cache.get("groq", key) is None
+    cache.put("groq", key, b"new")
+    assert (cache_dir / "groq" / key).read_bytes() == b"old"
+
+
+def test_prune_removes_only_expired_files(cache_dir: Path) -> None:
+    fresh, stale = cache.make_key("fresh"), cache.make_key("stale")
+    cache.put("groq", fresh, b"1")
+    cache.put("groq", stale, b"2")
+    cache.put("scrape", stale, b"3")
+    _age(cache_dir / "groq" / stale, cache.DEFAULT_TTL + 60)
+    _age(cache_dir / "scrape" / stale, cache.DEFAULT_TTL + 60)
+    # A temp file left behind by an interrupted put()
+    leftover = cache_dir / "groq" / f"{fresh}.123.456.tmp"
+    leftover.write_bytes(b"partial")
+    _age(leftover, cache.DEFAULT_TTL + 60)
+
+    assert cache.prune() == 3
+    assert sorted(path.name for path in cache_dir.rglob("*") if path.is_file()) == [fresh]
+    assert cache.get("groq", fresh) == b"1"
+    assert cache.prune() == 0
+
+
+def test_prune_without_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache, "get_cache_dir", lambda: tmp_path / "missing")
+    assert cache.prune() == 0
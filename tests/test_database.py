@@ -0,0 +1,151 @@
+"""Tests for the SQLite application store and its schema migrations."""
+
+import calendar
+import sqlite3
+from pathlib import Path
+
+from database import Application, ApplicationDB
+
+# Schema written by releases that kept tags as JSON and date_created as TEXT
+_LEGACY_SCHEMA = """
+CREATE TABLE applications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company TEXT NOT NULL,
+    title TEXT NOT NULL,
+    url TEXT,
+    status TEXT DEFAULT 'saved',
+    notes TEXT,
+    date_applied TEXT,
+    date_created TEXT DEFAULT CURRENT_TIMESTAMP,
+    resume_path TEXT,
+    cover_letter_path TEXT,
+    salary TEXT,
+    location TEXT,
+    tags TEXT
+)
+"""
+
+
+def _make_legacy_db(path: Path, rows: list[tuple[str, str, str, str, str | None]]) -> None:
+    """Create a legacy database holding (company, title, status, date_created, tags) rows."""
+    conn = sqlite3.connect(path)
+    conn.execute(_LEGACY_SCHEMA)
+    conn.executemany(
+        "INSERT INTO applications (company, title, status, date_created, tags) VALUES (?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+def _get(app_id: int) -> Application:
+    """Fetch an application that must exist."""
+    app = ApplicationDB.get_by_id(app_id)
+    assert app is not None
+    return app
+
+
+def test_legacy_json_tags_are_migrated_in_order(db_path: Path) -> None:
+    _make_legacy_db(
+        db_path,
+        [
+            ("Acme", "Engineer", "applied", "2024-01-02 03:04:05", '["remote", "backend", "python"]'),
+            ("Globex", "Analyst", "saved", "2024-02-03 04:05:06", None),
+            ("Initech", "Developer", "saved", "2024-03-04 05:06:07", "not json"),
+        ],
+    )
+
+    assert _get(1).tags == ["remote", "backend", "python"]
+    assert _get(2).tags == []
+    # Unparseable legacy tags are dropped rather than failing the migration
+    assert _get(3).tags == []
+
+    conn = sqlite3.connect(db_path)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(applications)")}
+    conn.close()
+    assert "tags" not in columns
+
+
+def test_tags_keep_their_order_and_drop_repeats(db_path: Path) -> None:
+    app_id = ApplicationDB.create(Application(company="Acme", title="Engineer", tags=["zeta", "alpha", "zeta", "mu"]))
+    assert _get(app_id).to_dict()["tags"] == ["zeta", "alpha", "mu"]
+
+    ApplicationDB.update(app_id, tags=["b", "a"])
+    assert _get(app_id).tags == ["b", "a"]
+    assert [app["tags"] for app in ApplicationDB.get_all()] == [["b", "a"]]
+
+
+def test_tags_are_removed_with_their_application(db_path: Path) -> None:
+    keep = ApplicationDB.create(Application(company="Acme", title="Engineer", tags=["x"]))
+    drop = ApplicationDB.create(Application(company="Globex", title="Analyst", tags=["y", "z"]))
+
+    ApplicationDB.delete(drop)
+
+    conn = sqlite3.connect(db_path)
+    remaining = conn.execute("SELECT app_id, tag FROM application_tags ORDER BY tag").fetchall()
+    conn.close()
+    assert remaining == [(keep, "x")]
+
+
+def test_legacy_text_dates_become_unix_timestamps(db_path: Path) -> None:
+    _make_legacy_db(
+        db_path,
+        [
+            ("Acme", "Engineer", "applied", "2024-01-02 03:04:05", '["remote"]'),
+            ("Globex", "Analyst", "saved", "2023-06-07 08:09:10", None),
+        ],
+    )
+
+    apps = ApplicationDB.get_all()
+    # Newest first, formatted the way CURRENT_TIMESTAMP used to store them
+    assert [(app["company"], app["date_created"]) for app in apps] == [
+        ("Acme", "2024-01-02 03:04:05"),
+        ("Globex", "2023-06-07 08:09:10"),
+    ]
+    assert _get(1).tags == ["remote"]
+
+    conn = sqlite3.connect(db_path)
+    column_type = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(applications)")}["date_created"]
+    stored = conn.execute("SELECT date_created FROM applications WHERE id = 1").fetchone()[0]
+    conn.close()
+    assert column_type.upper() == "INTEGER"
+    assert stored == calendar.timegm((2024, 1, 2, 3, 4, 5))
+
+
+def test_migration_runs_once(db_path: Path) -> None:
+    _make_legacy_db(db_path, [("Acme", "Engineer", "applied", "2024-01-02 03:04:05", '["a", "b"]')])
+    ApplicationDB.get_all()
+    ApplicationDB._close()
+
+    # Re-initializing an already migrated database must not duplicate or reorder anything
+    assert [(app["date_created"], app["tags"]) for app in ApplicationDB.get_all()] == [
+        ("2024-01-02 03:04:05", ["a", "b"])
+    ]
+
+
+def test_stats_counters_follow_writes(db_path: Path) -> None:
+    _make_legacy_db(
+        db_path,
+        [
+            ("Acme", "Engineer", "applied", "2024-01-02 03:04:05", None),
+            ("Globex", "Analyst", "applied", "2024-01-03 03:04:05", None),
+            ("Initech", "Developer", "saved", "2024-01-04 03:04:05", None),
+        ],
+    )
+
+    # Counters are rebuilt from existing rows on first use, with every status present
+    stats = ApplicationDB.get_stats()
+    assert set(stats) == Application.STATUS_SET
+    assert stats["applied"] == 2 and stats["saved"] == 1 and stats["offer"] == 0
+
+    new_id = ApplicationDB.create(Application(company="Hooli", title="SRE", status="interview"))
+    ApplicationDB.update(1, status="offer")
+    ApplicationDB.delete(3)
+    ApplicationDB.delete_many([2, new_id])
+
+    stats = ApplicationDB.get_stats()
+    assert {status: count for status, count in stats.items() if count} == {"offer": 1}
+    assert sum(stats.values()) == len(ApplicationDB.get_all())
+
+    ApplicationDB.reset_all()
+    assert sum(ApplicationDB.get_stats().values()) == 0
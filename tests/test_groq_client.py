@@ -0,0 +1,306 @@
+"""Tests for the Groq client: transport, retries and packed cover-letter responses."""
+
+import http.client
+from typing import Any
+
+import pytest
+
+import groq_client
+import json_utils
+from exceptions import APIAccessDeniedError, APIKeyError, APIRateLimitError
+from rate_limiter import RateLimiter
+
+_JOBS = [
+    {"title": "Engineer", "company": "Acme", "description": "Build things."},
+    {"title": "Analyst", "company": "Globex", "description": "Study things."},
+]
+
+
+@pytest.fixture
+def reply(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """Replace the Groq call with a canned response; records the prompt sent."""
+    state: dict[str, Any] = {"response": ""}
+
+    def fake_complete(system: str, prompt: str, **kwargs: Any) -> str:
+        state["prompt"] = prompt
+        return str(state["response"])
+
+    monkeypatch.setattr(groq_client, "_complete", fake_complete)
+    return state
+
+
+def test_letters_are_split_in_job_order(reply: dict[str, Any]) -> None:
+    reply["response"] = '{"letters": ["  Dear Acme  ", "Dear Globex"]}'
+
+    assert groq_client.generate_cover_letters(_JOBS, "resume") == ["Dear Acme", "Dear Globex"]
+    assert "JOB 1:\nJOB TITLE: Engineer\nCOMPANY: Acme" in reply["prompt"]
+    assert "JOB 2:\nJOB TITLE: Analyst\nCOMPANY: Globex" in reply["prompt"]
+    assert "exactly 2 strings" in reply["prompt"]
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        '```json\n{"letters": ["Dear Acme", "Dear Globex"]}\n```',
+        '["Dear Acme", "Dear Globex"]',
+    ],
+)
+def test_fenced_or_bare_list_responses_are_accepted(reply: dict[str, Any], response: str) -> None:
+    reply["response"] = response
+    assert groq_client.generate_cover_letters(_JOBS, "resume") == ["Dear Acme", "Dear Globex"]
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        "Dear Acme, ... Dear Globex, ...",
+        '{"letters": ["Dear Acme"]}',
+        '{"letters": "Dear Acme"}',
+        '{"other": []}',
+    ],
+)
+def test_unsplittable_responses_fall_back_for_every_job(reply: dict[str, Any], response: str) -> None:
+    reply["response"] = response
+    assert groq_client.generate_cover_letters(_JOBS, "resume") == [None, None]
+
+
+def test_blank_or_non_string_letters_fall_back_individually(reply: dict[str, Any]) -> None:
+    reply["response"] = '{"letters": ["Dear Acme", "   "]}'
+    assert groq_client.generate_cover_letters(_JOBS, "resume") == ["Dear Acme", None]
+
+    reply["response"] = '{"letters": [42, "Dear Globex"]}'
+    assert groq_client.generate_cover_letters(_JOBS, "resume") == [None, "Dear Globex"]
+
+
+def test_too_many_jobs_are_rejected(reply: dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        groq_client.generate_cover_letters(_JOBS * groq_client.MAX_PACKED_COVER_LETTERS, "resume")
+    assert "prompt" not in reply
+
+
+@pytest.fixture
+def api(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """Replace the transport with canned (status, body, headers) replies; records sleeps."""
+    state: dict[str, Any] = {"replies": [], "calls": 0, "slept": []}
+
+    def fake_post(body: bytes, headers: dict[str, str], on_chunk: Any = None) -> tuple[int, bytes, dict[str, str]]:
+        state["calls"] += 1
+        reply = state["replies"].pop(0)
+        if isinstance(reply, BaseException):
+            raise reply
+        return reply
+
+    monkeypatch.setattr(groq_client, "_API_KEY", "gsk_test")
+    monkeypatch.setattr(groq_client, "_post", fake_post)
+    monkeypatch.setattr(groq_client, "_rate_limiter", lambda: RateLimiter(0, 0))
+    monkeypatch.setattr(groq_client.time, "sleep", state["slept"].append)
+    monkeypatch.setattr(groq_client.random, "random", lambda: 0.0)
+    return state
+
+
+def _ok(text: str) -> tuple[int, bytes, dict[str, str]]:
+    """A successful non-streamed completion reply."""
+    return 200, json_utils.dumpb({"choices": [{"message": {"content": text}}]}), {}
+
+
+def _call() -> str:
+    return groq_client.call_groq_api([{"role": "user", "content": "hi"}], use_cache=False)
+
+
+@pytest.mark.parametrize(
+    ("retry_after", "attempt", "expected"),
+    [("5", 0, 5.0), ("1000", 0, 60.0), ("-3", 0, 0.0), (None, 0, 1.0), (None, 2, 4.0), (None, 10, 60.0)],
+)
+def test_retry_delay_honours_retry_after_with_cap(
+    api: dict[str, Any], retry_after: str | None, attempt: int, expected: float
+) -> None:
+    assert groq_client._retry_delay(retry_after, attempt) == expected
+
+
+def test_retry_delay_falls_back_for_http_dates(api: dict[str, Any]) -> None:
+    assert groq_client._retry_delay("Wed, 21 Oct 2015 07:28:00 GMT", 1) == 2.0
+
+
+def test_transient_statuses_are_retried_until_success(api: dict[str, Any]) -> None:
+    api["replies"] = [(429, b"{}", {"Retry-After": "7"}), (503, b"{}", {}), _ok("done")]
+
+    assert _call() == "done"
+    assert api["calls"] == 3
+    assert api["slept"] == [7.0, 2.0]
+
+
+def test_retries_stop_after_max_and_map_the_last_status(api: dict[str, Any]) -> None:
+    api["replies"] = [(429, b"{}", {"Retry-After": "1"})] * (groq_client._MAX_RETRIES + 1)
+
+    with pytest.raises(APIRateLimitError):
+        _call()
+    assert api["calls"] == groq_client._MAX_RETRIES + 1
+    assert api["slept"] == [1.0] * groq_client._MAX_RETRIES
+
+
+@pytest.mark.parametrize(
+    ("status", "error"),
+    [(401, APIKeyError), (403, APIAccessDeniedError), (400, RuntimeError), (404, RuntimeError)],
+)
+def test_non_retryable_statuses_raise_immediately(api: dict[str, Any], status: int, error: type) -> None:
+    api["replies"] = [(status, b'{"error": "nope"}', {})]
+
+    with pytest.raises(error):
+        _call()
+    assert api["calls"] == 1
+    assert api["slept"] == []
+
+
+def test_transport_errors_become_runtime_errors(api: dict[str, Any]) -> None:
+    api["replies"] = [OSError("network down")]
+
+    with pytest.raises(RuntimeError, match="network down"):
+        _call()
+
+
+class _FakeResponse:
+    """Minimal http.client.HTTPResponse: iterable lines plus read()."""
+
+    def __init__(
+        self, status: int = 200, body: bytes = b"", will_close: bool = False, lines: list[bytes] | None = None
+    ) -> None:
+        self.status = status
+        self.will_close = will_close
+        self.headers: dict[str, str] = {}
+        self._body = body
+        self._lines = lines or []
+        self.drained = False
+
+    def __iter__(self) -> Any:
+        return iter(self._lines)
+
+    def read(self) -> bytes:
+        self.drained = True
+        body, self._body = self._body, b""
+        return body
+
+
+class _FakeConnection:
+    """Stand-in for HTTPSConnection that replays queued responses or errors."""
+
+    def __init__(self, *replies: Any, connected: bool = False) -> None:
+        self.replies = list(replies)
+        self.sock: object | None = object() if connected else None
+        self.closed = False
+        self.requests = 0
+
+    def request(self, method: str, path: str, body: bytes, headers: dict[str, str]) -> None:
+        self.requests += 1
+        self.sock = object()
+
+    def getresponse(self) -> _FakeResponse:
+        reply = self.replies.pop(0)
+        if isinstance(reply, BaseException):
+            raise reply
+        return reply
+
+    def close(self) -> None:
+        self.closed = True
+        self.sock = None
+
+
+@pytest.fixture
+def pool(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """Empty the keep-alive pool and hand out queued fake connections as new ones."""
+    state: dict[str, Any] = {"pool": [], "fresh": [], "opened": 0}
+
+    def new_connection() -> _FakeConnection:
+        state["opened"] += 1
+        return state["fresh"].pop(0)
+
+    monkeypatch.setattr(groq_client, "_pool", state["pool"])
+    monkeypatch.setattr(groq_client, "_new_connection", new_connection)
+    return state
+
+
+def test_keep_alive_connection_is_reused(pool: dict[str, Any]) -> None:
+    conn = _FakeConnection(_FakeResponse(body=b"one"), _FakeResponse(body=b"two"))
+    pool["fresh"] = [conn]
+
+    assert groq_client._post(b"{}", {})[:2] == (200, b"one")
+    assert pool["pool"] == [conn]
+    assert groq_client._post(b"{}", {})[:2] == (200, b"two")
+    assert pool["opened"] == 1
+    assert conn.requests == 2 and not conn.closed
+
+
+def test_connection_is_not_pooled_when_server_closes_it(pool: dict[str, Any]) -> None:
+    conn = _FakeConnection(_FakeResponse(body=b"bye", will_close=True))
+    pool["fresh"] = [conn]
+
+    assert groq_client._post(b"{}", {})[:2] == (200, b"bye")
+    assert conn.closed
+    assert pool["pool"] == []
+
+
+def test_stale_reused_connection_is_retried_once_on_a_fresh_one(pool: dict[str, Any]) -> None:
+    stale = _FakeConnection(http.client.RemoteDisconnected("closed"), connected=True)
+    fresh = _FakeConnection(_FakeResponse(body=b"ok"))
+    pool["pool"].append(stale)
+    pool["fresh"] = [fresh]
+
+    assert groq_client._post(b"{}", {})[:2] == (200, b"ok")
+    assert stale.closed
+    assert pool["opened"] == 1
+    assert pool["pool"] == [fresh]
+
+
+def test_failure_on_a_new_connection_is_not_retried(pool: dict[str, Any]) -> None:
+    conn = _FakeConnection(http.client.RemoteDisconnected("closed"))
+    pool["fresh"] = [conn]
+
+    with pytest.raises(http.client.RemoteDisconnected):
+        groq_client._post(b"{}", {})
+    assert conn.closed
+    assert pool["opened"] == 1
+    assert pool["pool"] == []
+
+
+def test_pool_is_capped(pool: dict[str, Any]) -> None:
+    conns = [_FakeConnection() for _ in range(groq_client._POOL_SIZE + 1)]
+    for conn in conns:
+        groq_client._release_connection(conn)  # type: ignore[arg-type]
+
+    assert pool["pool"] == conns[:-1]
+    assert conns[-1].closed
+
+
+def _event(delta: dict[str, str]) -> bytes:
+    return b"data: " + json_utils.dumpb({"choices": [{"delta": delta}]}) + b"\n"
+
+
+def test_read_event_stream_forwards_content_deltas() -> None:
+    resp = _FakeResponse(
+        lines=[
+            _event({"role": "assistant"}),
+            b"\n",
+            b": keep-alive\n",
+            _event({"content": "Hel"}),
+            b"\n",
+            _event({"content": "lo"}),
+            b"data: [DONE]\n",
+            _event({"content": "ignored"}),
+        ]
+    )
+    chunks: list[str] = []
+
+    assert groq_client._read_event_stream(resp, chunks.append) == b"Hello"  # type: ignore[arg-type]
+    assert chunks == ["Hel", "lo"]
+    assert resp.drained
+
+
+def test_send_streams_only_successful_responses(pool: dict[str, Any]) -> None:
+    chunks: list[str] = []
+    conn = _FakeConnection(
+        _FakeResponse(lines=[_event({"content": "hi"}), b"data: [DONE]\n"]),
+        _FakeResponse(status=429, body=b'{"error": "slow down"}'),
+    )
+
+    assert groq_client._send(conn, b"{}", {}, chunks.append)[:2] == (200, b"hi")  # type: ignore[arg-type]
+    assert groq_client._send(conn, b"{}", {}, chunks.append)[:2] == (429, b'{"error": "slow down"}')  # type: ignore[arg-type]
+    assert chunks == ["hi"]
@@ -0,0 +1,97 @@
+"""Tests for conditional GETs on the document endpoints."""
+
+import importlib
+import os
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient  # noqa: E402
+
+_REPO = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def main(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> ModuleType:
+    """Import the web app (static files resolve from the repo), then work from a temp dir."""
+    monkeypatch.chdir(_REPO)
+    module = importlib.import_module("main")
+    monkeypatch.chdir(tmp_path)
+    return module
+
+
+@pytest.fixture
+def client(main: ModuleType) -> TestClient:
+    # Not used as a context manager, so startup hooks (migration, warm-up) do not run
+    return TestClient(main.app)
+
+
+def test_resume_revalidates_with_etag(client: TestClient, tmp_path: Path) -> None:
+    resume = tmp_path / "Acme_Engineer" / "Resume.tex"
+    resume.parent.mkdir()
+    resume.write_text("\\documentclass{article}", encoding="utf-8")
+
+    first = client.get("/resume/Acme_Engineer")
+    assert first.status_code == 200
+    assert first.json() == {"content": "\\documentclass{article}", "folder": "Acme_Engineer"}
+    etag = first.headers["etag"]
+    assert first.headers["last-modified"]
+    assert "must-revalidate" in first.headers["cache-control"]
+
+    unchanged = client.get("/resume/Acme_Engineer", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert unchanged.headers["etag"] == etag
+
+    resume.write_text("\\documentclass{article} % edited", encoding="utf-8")
+    stamp = resume.stat().st_mtime + 5
+    os.utime(resume, (stamp, stamp))
+    changed = client.get("/resume/Acme_Engineer", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["content"].endswith("% edited")
+
+
+def test_cover_letter_mismatched_etag_gets_full_body(client: TestClient, tmp_path: Path) -> None:
+    letter = tmp_path / "Acme_Engineer" / "Cover_Letter.txt"
+    letter.parent.mkdir()
+    letter.write_text("Dear Hiring Manager,", encoding="utf-8")
+
+    response = client.get("/cover-letter/Acme_Engineer", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.json()["content"] == "Dear Hiring Manager,"
+
+
+def test_missing_documents_are_404(client: TestClient) -> None:
+    assert client.get("/resume/Nope").status_code == 404
+    assert client.get("/cover-letter/Nope", headers={"If-None-Match": '"x"'}).status_code == 404
+
+
+def test_template_revalidates_with_etag(client: TestClient) -> None:
+    first = client.get("/template")
+    assert first.status_code == 200
+    again = client.get("/template", headers={"If-None-Match": first.headers["etag"]})
+    assert again.status_code == 304
+
+
+def test_raw_endpoint_serves_every_listed_folder(client: TestClient, tmp_path: Path) -> None:
+    target = tmp_path / "elsewhere" / "Linked_Job"
+    target.mkdir(parents=True)
+    (target / "Resume.tex").write_text("linked", encoding="utf-8")
+    (tmp_path / "Linked_Job").symlink_to(target, target_is_directory=True)
+
+    listed = [item["folder"] for item in client.get("/list-resumes").json()]
+    assert "Linked_Job" in listed
+    for folder in listed:
+        assert client.get(f"/raw/resume/{folder}").status_code == 200
+    assert client.get("/raw/resume/Linked_Job").text == "linked"
+
+
+@pytest.mark.parametrize("folder", ["", ".", "..", "../etc", "a/b", "/etc"])
+def test_job_file_rejects_folder_names_outside_cwd(main: ModuleType, folder: str) -> None:
+    with pytest.raises(main.HTTPException) as excinfo:
+        main._job_file(folder, "Resume.tex")
+    assert excinfo.value.status_code == 403
@@ -0,0 +1,66 @@
+"""Tests for the client-side Groq request pacer."""
+
+import pytest
+
+import rate_limiter
+from rate_limiter import RateLimiter
+
+
+class _FakeClock:
+    """Stand-in for time.monotonic/time.sleep where sleeping advances the clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.slept: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    fake = _FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(rate_limiter.time, "sleep", fake.sleep)
+    return fake
+
+
+def test_requests_per_minute_spaces_out_bursts(clock: _FakeClock) -> None:
+    limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=0)
+
+    # The bucket starts full: the first two requests go straight through
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 0
+    # Then one request every 30 seconds
+    assert limiter.acquire() == pytest.approx(30)
+    assert limiter.acquire() == pytest.approx(30)
+    assert clock.slept == pytest.approx([30, 30])
+
+
+def test_tokens_per_minute_waits_for_refill(clock: _FakeClock) -> None:
+    limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=600)
+
+    assert limiter.acquire(500) == 0
+    # 400 tokens short at 10 tokens/second
+    assert limiter.acquire(500) == pytest.approx(40)
+    clock.now += 60
+    assert limiter.acquire(100) == 0
+
+
+def test_request_larger_than_bucket_is_capped(clock: _FakeClock) -> None:
+    limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=600)
+
+    # Charged as one full bucket instead of waiting forever
+    assert limiter.acquire(10_000) == 0
+    assert limiter.acquire(600) == pytest.approx(60)
+
+
+def test_zero_limits_disable_pacing(clock: _FakeClock) -> None:
+    limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=0)
+
+    assert all(limiter.acquire(1_000_000) == 0 for _ in range(100))
+    assert clock.slept == []